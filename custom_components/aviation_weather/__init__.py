@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from functools import lru_cache
 
 import aiohttp
 import voluptuous as vol
@@ -14,6 +15,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.helpers.config_validation as cv
 
+from .const import FORMATTED_OUTPUTS
 from .metar_parser import parse_metar, format_metar
 from .taf_parser import parse_taf, format_taf
 
@@ -27,6 +29,42 @@ CONF_SCAN_INTERVAL = "scan_interval"
 
 SERVICE_REFRESH = "refresh"
 
+# Pre-formatted output variants per report type: (data key, eol, is_html)
+_METAR_FORMATS = tuple(
+    entry for (data_type, _), entry in FORMATTED_OUTPUTS.items()
+    if data_type == "metar_formatted"
+)
+_TAF_FORMATS = tuple(
+    entry for (data_type, _), entry in FORMATTED_OUTPUTS.items()
+    if data_type == "taf_formatted"
+)
+
+
+# Parse results are cached here only, and each cached dict is shared by the
+# coordinator data, the sensors' attributes and the formatters: never mutate it.
+@lru_cache(maxsize=128)
+def _parse_metar_cached(raw: str) -> dict:
+    """Parse a raw METAR, memoized on the report text (shared; do not mutate)."""
+    return parse_metar(raw)
+
+
+@lru_cache(maxsize=128)
+def _parse_taf_cached(raw: str) -> dict:
+    """Parse a raw TAF, memoized on the forecast text (shared; do not mutate)."""
+    return parse_taf(raw)
+
+
+@lru_cache(maxsize=512)
+def _format_metar_cached(raw: str, eol: str, is_html: bool) -> str:
+    """Format a raw METAR, memoized on the report text."""
+    return format_metar(_parse_metar_cached(raw), eol=eol, is_html=is_html)
+
+
+@lru_cache(maxsize=512)
+def _format_taf_cached(raw: str, eol: str, is_html: bool) -> str:
+    """Format a raw TAF, memoized on the forecast text."""
+    return format_taf(_parse_taf_cached(raw), eol=eol, is_html=is_html)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Aviation Weather from a config entry."""
@@ -151,18 +189,24 @@ class AviationWeatherDataUpdateCoordinator(DataUpdateCoordinator):
                 # Parse METAR if available
                 if "rawOb" in data and data["rawOb"]:
                     try:
-                        parsed_metar = parse_metar(data["rawOb"])
+                        parsed_metar = _parse_metar_cached(data["rawOb"])
                         data["parsed_metar"] = parsed_metar
+                        # Attributes shared by all formatted METAR sensors
+                        data["_base_metar_attrs"] = {
+                            "aerodrome": aerodrome,
+                            "data_source": "Formatted Output",
+                            "raw_metar": data["rawOb"],
+                            "parse_success": True,
+                        }
                         _LOGGER.debug("Successfully parsed METAR for %s", aerodrome)
                         
                         # Try to format the METAR
                         try:
-                            formatted_text = format_metar(parsed_metar, eol="\n", is_html=False)
-                            formatted_html = format_metar(parsed_metar, eol="<br>", is_html=False)
-                            formatted_html_rich = format_metar(parsed_metar, eol="<br>", is_html=True)
-                            data["formatted_metar_text"] = formatted_text
-                            data["formatted_metar_html"] = formatted_html
-                            data["formatted_metar_html_rich"] = formatted_html_rich
+                            for key, eol, is_html in _METAR_FORMATS:
+                                formatted = _format_metar_cached(data["rawOb"], eol, is_html)
+                                data[key] = formatted
+                                # Character count used as the sensor state
+                                data[f"{key}_len"] = f"{len(formatted)} chars"
                             _LOGGER.debug("Successfully formatted METAR for %s", aerodrome)
                         except Exception as format_err:
                             _LOGGER.warning(
@@ -170,7 +214,10 @@ class AviationWeatherDataUpdateCoordinator(DataUpdateCoordinator):
                                 aerodrome,
                                 format_err,
                             )
-                            data["parsed_metar"]["_format_error"] = True
+                            # Record the failure so sensors never need to re-format
+                            for key, _, _ in _METAR_FORMATS:
+                                data[key] = f"Error: {format_err}"
+                                data[f"{key}_len"] = "Format failed"
                             
                     except Exception as parse_err:
                         _LOGGER.warning(
@@ -183,18 +230,24 @@ class AviationWeatherDataUpdateCoordinator(DataUpdateCoordinator):
                 # Parse TAF if available
                 if "rawTaf" in data and data["rawTaf"]:
                     try:
-                        parsed_taf = parse_taf(data["rawTaf"])
+                        parsed_taf = _parse_taf_cached(data["rawTaf"])
                         data["parsed_taf"] = parsed_taf
+                        # Attributes shared by all formatted TAF sensors
+                        data["_base_taf_attrs"] = {
+                            "aerodrome": aerodrome,
+                            "data_source": "Formatted Output",
+                            "raw_taf": data["rawTaf"],
+                            "parse_success": True,
+                        }
                         _LOGGER.debug("Successfully parsed TAF for %s", aerodrome)
                         
                         # Try to format the TAF
                         try:
-                            formatted_text = format_taf(parsed_taf, eol="<br>", is_html=False)
-                            formatted_html = format_taf(parsed_taf, eol="\n", is_html=False)
-                            formatted_html_rich = format_taf(parsed_taf, eol="\n", is_html=True)
-                            data["formatted_taf_text"] = formatted_text
-                            data["formatted_taf_html"] = formatted_html
-                            data["formatted_taf_html_rich"] = formatted_html_rich
+                            for key, eol, is_html in _TAF_FORMATS:
+                                formatted = _format_taf_cached(data["rawTaf"], eol, is_html)
+                                data[key] = formatted
+                                # Character count used as the sensor state
+                                data[f"{key}_len"] = f"{len(formatted)} chars"
                             _LOGGER.debug("Successfully formatted TAF for %s", aerodrome)
                         except Exception as format_err:
                             _LOGGER.warning(
@@ -202,7 +255,10 @@ class AviationWeatherDataUpdateCoordinator(DataUpdateCoordinator):
                                 aerodrome,
                                 format_err,
                             )
-                            data["parsed_taf"]["_format_error"] = True
+                            # Record the failure so sensors never need to re-format
+                            for key, _, _ in _TAF_FORMATS:
+                                data[key] = f"Error: {format_err}"
+                                data[f"{key}_len"] = "Format failed"
                             
                     except Exception as parse_err:
                         _LOGGER.warning(
@@ -6,3 +6,14 @@ CONF_AERODROMES = "aerodromes"
 CONF_SCAN_INTERVAL = "scan_interval"
 
 DEFAULT_SCAN_INTERVAL = 30  # minutes
+
+# Pre-formatted output variants computed by the coordinator:
+# (data_type, variant) -> (data key, eol, is_html)
+FORMATTED_OUTPUTS = {
+    ("metar_formatted", "text"): ("formatted_metar_text", "\n", False),
+    ("metar_formatted", "html"): ("formatted_metar_html", "<br>", False),
+    ("metar_formatted", "html_rich"): ("formatted_metar_html_rich", "<br>", True),
+    ("taf_formatted", "text"): ("formatted_taf_text", "<br>", False),
+    ("taf_formatted", "html"): ("formatted_taf_html", "\n", False),
+    ("taf_formatted", "html_rich"): ("formatted_taf_html_rich", "\n", True),
+}
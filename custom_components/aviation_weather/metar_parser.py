@@ -17,27 +17,78 @@ Version: 2.4.1
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 __version__ = "2.4.1"
 __all__ = ["parse_metar", "format_metar", "get_ordinal"]
 
+# Regular expressions, compiled once at import
+
+# Leading report type prefix ("METAR " or "SPECI ")
+_RE_REPORT_TYPE = re.compile(r'^(METAR|SPECI)\s+')
+_RE_STATION = re.compile(r'^([A-Z]{4})')
+_RE_OBSERVATION_TIME = re.compile(r"(\d{2})(\d{2})(\d{2})Z")
+_RE_WIND = re.compile(r'\b(\d{3}|VRB)(\d{2,3})(G(\d{2,3}))?(KT|MPS|KMH)\b')
+_RE_WIND_VARIATION = re.compile(r'(\d{3})V(\d{3})')
+_RE_VISIBILITY = re.compile(r'\b(CAVOK|\d{4}|((\d+ )?\d+/\d+|(\d+))SM)\b')
+# Weather phenomena, starting a group or following another phenomenon (e.g. RADZ)
+# and ending the group or running into the next one, so that letters inside
+# other groups (e.g. station VABB or EGSS) are skipped
+_WX_PHENOMENA = r'DZ|RA|SN|SG|IC|PL|GR|GS|UP|BR|FG|FU|VA|DU|SA|HZ|PY|SQ|FC|SS|DS'
+_RE_WEATHER = re.compile(
+    r'(?:(?<!\S)|(?<=' + _WX_PHENOMENA + r'))'
+    r'(-|\+|VC)?(MI|PR|BC|DR|BL|SH|TS|FZ)?(' + _WX_PHENOMENA + r')(?=' + _WX_PHENOMENA + r'|\b)'
+)
+_RE_CLOUD = re.compile(r'\b(FEW|SCT|BKN|OVC|VV|NSC)(\d{3}|///)?\b')
+_RE_TEMPERATURE_DEWPOINT = re.compile(r'(\d{2}|M\d{2})/(\d{2}|M\d{2})')
+_RE_ALTIMETER = re.compile(r'\b(Q\d{4}|A\d{4})\b')
+_RE_REMARKS = re.compile(r'\bRMK\b(.*)')
+
+# Conversion factors to knots for wind units
+_KNOTS_FACTOR = {"KT": 1.0, "MPS": 1.94384, "KMH": 0.539957}
+
+
+def _to_knots(speed: int, gust: Optional[int], unit: str) -> Tuple[int, Optional[int]]:
+    """Convert a wind speed and optional gust to knots."""
+    factor = _KNOTS_FACTOR[unit]
+    if factor == 1.0:
+        return speed, gust
+    return round(speed * factor), (round(gust * factor) if gust else None)
+
+
+_ORDINAL_SUFFIXES = {1: 'st', 2: 'nd', 3: 'rd'}
+
 
 def get_ordinal(i: int) -> str:
     """Get the ordinal suffix for a given number."""
     try:
         i = int(i)
-        suffixes = {1: 'st', 2: 'nd', 3: 'rd'}
         if 10 <= i % 100 <= 20:
             return 'th'
         else:
-            return suffixes.get(i % 10, 'th')
+            return _ORDINAL_SUFFIXES.get(i % 10, 'th')
     except (ValueError, TypeError):
         return 'th'
 
 
 def parse_metar(metar: str) -> Dict[str, Any]:
-    """Parse a METAR string into a structured dictionary."""
+    """
+    Parse a METAR string into a structured dictionary.
+    
+    Examples:
+        >>> parse_metar("EGLL 121150Z 24010KT 9999 -RADZ BKN030 15/10 Q1013")["weather"]
+        [{'intensity': '-', 'descriptor': None, 'phenomenon': 'RA'}, {'intensity': None, 'descriptor': None, 'phenomenon': 'DZ'}]
+        >>> [parse_metar(f"{station} 121150Z 24010KT 9999 FEW030 15/10 Q1013").get("weather")
+        ...  for station in ("VABB", "SAEZ", "SGAS")]
+        [None, None, None]
+        
+        Recent weather groups (RE prefix) describe weather that has ended, so
+        they are not reported as current weather:
+        
+        >>> parse_metar("EGLL 121150Z 24010KT 9999 FEW030 15/10 Q1013 RERA RETSRA").get("weather") is None
+        True
+    """
     parsed = {}
     
     if not metar or not isinstance(metar, str):
@@ -47,16 +98,16 @@ def parse_metar(metar: str) -> Dict[str, Any]:
     # station ID regex always sees the 4-letter ICAO code first.  Without this,
     # a string like "METAR EGLL ..." causes the regex to capture "META" instead
     # of the actual station identifier.
-    metar = re.sub(r'^(METAR|SPECI)\s+', '', metar.strip())
+    metar = _RE_REPORT_TYPE.sub('', metar.strip())
 
     try:
         # Station ID
-        station_match = re.match(r'^([A-Z]{4})', metar)
+        station_match = _RE_STATION.match(metar)
         if station_match:
             parsed['station_id'] = station_match.group(1)
         
         # Observation time
-        time_match = re.search(r"(\d{2})(\d{2})(\d{2})Z", metar)
+        time_match = _RE_OBSERVATION_TIME.search(metar)
         if time_match:
             day = int(time_match.group(1))
             hour = int(time_match.group(2))
@@ -68,19 +119,12 @@ def parse_metar(metar: str) -> Dict[str, Any]:
             parsed["observation_time_iso8601"] = f"T{hour:02}:{minute:02}:00Z"
         
         # Wind
-        wind_match = re.search(r'\b(\d{3}|VRB)(\d{2,3})(G(\d{2,3}))?(KT|MPS|KMH)\b', metar)
+        wind_match = _RE_WIND.search(metar)
         if wind_match:
-            wind_direction = wind_match.group(1)
-            wind_speed = int(wind_match.group(2))
-            wind_gust = int(wind_match.group(4)) if wind_match.group(4) else None
-            wind_unit = wind_match.group(5)
-            
-            if wind_unit == "MPS":
-                wind_speed = round(wind_speed * 1.94384)
-                wind_gust = round(wind_gust * 1.94384) if wind_gust else None
-            elif wind_unit == "KMH":
-                wind_speed = round(wind_speed * 0.539957)
-                wind_gust = round(wind_gust * 0.539957) if wind_gust else None
+            wind_direction, wind_speed, _, wind_gust, wind_unit = wind_match.groups()
+            wind_speed, wind_gust = _to_knots(
+                int(wind_speed), int(wind_gust) if wind_gust else None, wind_unit
+            )
             
             parsed['wind'] = {
                 "direction": wind_direction,
@@ -89,17 +133,15 @@ def parse_metar(metar: str) -> Dict[str, Any]:
             }
         
         # Wind variation
-        variation_match = re.search(r'(\d{3})V(\d{3})', metar)
+        variation_match = _RE_WIND_VARIATION.search(metar)
         if variation_match:
-            if 'wind' not in parsed:
-                parsed['wind'] = {}
-            parsed['wind']['variation'] = {
+            parsed.setdefault('wind', {})['variation'] = {
                 "from": int(variation_match.group(1)),
                 "to": int(variation_match.group(2))
             }
         
         # Visibility
-        visibility_match = re.search(r'\b(CAVOK|\d{4}|((\d+ )?\d+/\d+|(\d+))SM)\b', metar)
+        visibility_match = _RE_VISIBILITY.search(metar)
         if visibility_match:
             visibility = visibility_match.group(0)
             if visibility == "CAVOK":
@@ -110,10 +152,7 @@ def parse_metar(metar: str) -> Dict[str, Any]:
                 parsed['visibility'] = f"{visibility} meters"
         
         # Weather phenomena
-        weather_match = re.findall(
-            r'(-|\+|VC)?(MI|BC|DR|BL|SH|TS|FZ)?(DZ|RA|SN|SG|IC|PL|GR|GS|UP|BR|FG|FU|VA|DU|SA|HZ|PY|SQ|FC|SS|DS)',
-            metar
-        )
+        weather_match = _RE_WEATHER.findall(metar)
         if weather_match:
             parsed['weather'] = [
                 {
@@ -125,7 +164,7 @@ def parse_metar(metar: str) -> Dict[str, Any]:
             ]
         
         # Cloud layers
-        cloud_matches = re.findall(r'\b(FEW|SCT|BKN|OVC|VV|NSC)(\d{3}|///)?\b', metar)
+        cloud_matches = _RE_CLOUD.findall(metar)
         if cloud_matches:
             parsed['clouds'] = []
             for cloud in cloud_matches:
@@ -140,19 +179,19 @@ def parse_metar(metar: str) -> Dict[str, Any]:
                 parsed['clouds'].append({"type": cloud_type, "height": height})
         
         # Temperature and Dewpoint
-        temp_dewp_match = re.search(r'(\d{2}|M\d{2})/(\d{2}|M\d{2})', metar)
+        temp_dewp_match = _RE_TEMPERATURE_DEWPOINT.search(metar)
         if temp_dewp_match:
             temp_str, dewp_str = temp_dewp_match.groups()
             try:
-                temperature = int(temp_str.replace('M', '-'))
-                dewpoint = int(dewp_str.replace('M', '-'))
+                temperature = -int(temp_str[1:]) if temp_str[0] == 'M' else int(temp_str)
+                dewpoint = -int(dewp_str[1:]) if dewp_str[0] == 'M' else int(dewp_str)
                 parsed['temperature'] = temperature
                 parsed['dewpoint'] = dewpoint
             except ValueError:
                 pass
         
         # Altimeter
-        altimeter_match = re.search(r'\b(Q\d{4}|A\d{4})\b', metar)
+        altimeter_match = _RE_ALTIMETER.search(metar)
         if altimeter_match:
             altimeter = altimeter_match.group(0)
             try:
@@ -165,7 +204,7 @@ def parse_metar(metar: str) -> Dict[str, Any]:
                 pass
         
         # Remarks
-        remarks_match = re.search(r'\bRMK\b(.*)', metar)
+        remarks_match = _RE_REMARKS.search(metar)
         if remarks_match:
             parsed['remarks'] = remarks_match.group(1).strip()
     
@@ -175,8 +214,65 @@ def parse_metar(metar: str) -> Dict[str, Any]:
     return parsed
 
 
+# Plain-language descriptions used by both formatters
+_WEATHER_DESCRIPTIONS = {
+    "DZ": "Drizzle", "RA": "Rain", "SN": "Snow", "SG": "Snow Grains",
+    "IC": "Ice Crystals", "PL": "Ice Pellets", "GR": "Hail",
+    "GS": "Small Hail/Snow Pellets", "UP": "Unknown Precipitation",
+    "BR": "Mist", "FG": "Fog", "FU": "Smoke", "VA": "Volcanic Ash",
+    "DU": "Dust", "SA": "Sand", "HZ": "Haze", "PY": "Spray",
+    "SQ": "Squall", "SS": "Sandstorm", "DS": "Duststorm",
+    "FC": "Funnel Cloud",
+    "+": "Heavy", "-": "Light", "VC": "In the vicinity",
+    "MI": "Shallow", "PR": "Partial", "BC": "Patches", "DR": "Drifting", "BL": "Blowing",
+    "SH": "Showers", "TS": "Thunderstorm", "FZ": "Freezing",
+}
+_CLOUD_NAMES = {
+    "FEW": "Few", "SCT": "Scattered", "BKN": "Broken",
+    "OVC": "Overcast", "NSC": "No Significant Cloud", "VV": "Vertical Visibility"
+}
+
+
+def _describe_weather(weather: List[Dict[str, Any]]) -> List[str]:
+    """Describe each weather phenomenon in plain language."""
+    weather_descriptions = []
+    for wx in weather:
+        intensity = wx.get("intensity")
+        descriptor = wx.get("descriptor")
+        phenomenon = wx.get("phenomenon")
+        
+        if not intensity and not descriptor:
+            # Bare phenomenon (the common case, and NSW): a single lookup
+            weather_descriptions.append(_WEATHER_DESCRIPTIONS.get(phenomenon, phenomenon) if phenomenon else "")
+            continue
+        
+        weather_descriptions.append(
+            " ".join(_WEATHER_DESCRIPTIONS.get(code, code) for code in (intensity, descriptor, phenomenon) if code)
+        )
+    return weather_descriptions
+
+
+@lru_cache(maxsize=256)
+def _describe_cloud(cloud_type: str, height: Optional[int]) -> str:
+    """Describe a cloud layer, e.g. "Broken at 1500 feet"."""
+    height_str = f"{height * 100} feet" if height is not None else "unknown height"
+    return f"{_CLOUD_NAMES.get(cloud_type, cloud_type)} at {height_str}"
+
+
 # HTML formatting helper functions (similar to TAF)
 
+# Emoji lookup tables for the HTML formatter
+_CLOUD_EMOJI = {
+    "SKC": "&#9728;&#65039;",
+    "NSC": "&#9728;&#65039;",
+    "FEW": "&#9925;",
+    "SCT": "&#9925;",
+    "BKN": "&#9729;&#65039;",
+    "OVC": "&#9729;&#65039;",
+    "VV": "&#127787;&#65039;",
+}
+
+
 def _get_wind_emoji(speed: int, gust: Optional[int] = None) -> str:
     """Get appropriate wind emoji based on speed."""
     if gust and gust > 25:
@@ -225,15 +321,7 @@ def _get_weather_emoji(weather_list: List[Dict[str, Any]]) -> str:
 
 def _get_cloud_emoji(cloud_type: str) -> str:
     """Get appropriate cloud emoji based on cloud type."""
-    if cloud_type in ['SKC', 'NSC']:
-        return "&#9728;&#65039;"
-    elif cloud_type in ['FEW', 'SCT']:
-        return "&#9925;"
-    elif cloud_type in ['BKN', 'OVC']:
-        return "&#9729;&#65039;"
-    elif cloud_type == 'VV':
-        return "&#127787;&#65039;"
-    return "&#9729;&#65039;"
+    return _CLOUD_EMOJI.get(cloud_type, "&#9729;&#65039;")
 
 
 def _get_metar_css() -> str:
@@ -303,35 +391,7 @@ def _format_metar_html(parsed_metar: Dict[str, Any]) -> str:
         # Weather
         weather = parsed_metar.get('weather')
         if weather:
-            weather_code_descriptions = {
-                "DZ": "Drizzle", "RA": "Rain", "SN": "Snow", "SG": "Snow Grains",
-                "IC": "Ice Crystals", "PL": "Ice Pellets", "GR": "Hail",
-                "GS": "Small Hail/Snow Pellets", "UP": "Unknown Precipitation",
-                "BR": "Mist", "FG": "Fog", "FU": "Smoke", "VA": "Volcanic Ash",
-                "DU": "Dust", "SA": "Sand", "HZ": "Haze", "PY": "Spray",
-                "SQ": "Squall", "SS": "Sandstorm", "DS": "Duststorm",
-                "FC": "Funnel Cloud",
-                "+": "Heavy", "-": "Light", "VC": "In the vicinity",
-                "MI": "Shallow", "BC": "Patches", "DR": "Drifting", "BL": "Blowing",
-                "SH": "Showers", "TS": "Thunderstorm", "FZ": "Freezing",
-            }
-            
-            weather_descriptions = []
-            for wx in weather:
-                intensity = wx.get("intensity")
-                descriptor = wx.get("descriptor")
-                phenomenon = wx.get("phenomenon")
-                
-                description_parts = []
-                if intensity:
-                    description_parts.append(weather_code_descriptions.get(intensity, intensity))
-                if descriptor:
-                    description_parts.append(weather_code_descriptions.get(descriptor, descriptor))
-                if phenomenon:
-                    description_parts.append(weather_code_descriptions.get(phenomenon, phenomenon))
-                
-                description = " ".join(description_parts)
-                weather_descriptions.append(description.strip())
+            weather_descriptions = _describe_weather(weather)
             
             if weather_descriptions:
                 weather_emoji = _get_weather_emoji(weather)
@@ -339,20 +399,11 @@ def _format_metar_html(parsed_metar: Dict[str, Any]) -> str:
         
         # Clouds
         if 'clouds' in parsed_metar:
-            cloud_map = {
-                "FEW": "Few", "SCT": "Scattered", "BKN": "Broken",
-                "OVC": "Overcast", "NSC": "No Significant Cloud", "VV": "Vertical Visibility"
-            }
             lines.append('  <p><span class="label">Clouds:</span></p>')
             lines.append('  <ul>')
             for cloud in parsed_metar['clouds']:
-                cloud_type = cloud_map.get(cloud['type'], cloud['type'])
-                height = cloud.get('height')
                 cloud_emoji = _get_cloud_emoji(cloud['type'])
-                if height is not None:
-                    lines.append(f'    <li>{cloud_emoji} {cloud_type} at {height * 100} feet</li>')
-                else:
-                    lines.append(f'    <li>{cloud_emoji} {cloud_type} at unknown height</li>')
+                lines.append(f'    <li>{cloud_emoji} {_describe_cloud(cloud["type"], cloud.get("height"))}</li>')
             lines.append('  </ul>')
         
         # Temperature/Dewpoint
@@ -421,53 +472,16 @@ def _format_metar_text(parsed_metar: Dict[str, Any], eol: str = "\n") -> str:
         # Weather
         weather = parsed_metar.get('weather')
         if weather:
-            weather_code_descriptions = {
-                "DZ": "Drizzle", "RA": "Rain", "SN": "Snow", "SG": "Snow Grains",
-                "IC": "Ice Crystals", "PL": "Ice Pellets", "GR": "Hail",
-                "GS": "Small Hail/Snow Pellets", "UP": "Unknown Precipitation",
-                "BR": "Mist", "FG": "Fog", "FU": "Smoke", "VA": "Volcanic Ash",
-                "DU": "Dust", "SA": "Sand", "HZ": "Haze", "PY": "Spray",
-                "SQ": "Squall", "SS": "Sandstorm", "DS": "Duststorm",
-                "FC": "Funnel Cloud",
-                "+": "Heavy", "-": "Light", "VC": "In the vicinity",
-                "MI": "Shallow", "BC": "Patches", "DR": "Drifting", "BL": "Blowing",
-                "SH": "Showers", "TS": "Thunderstorm", "FZ": "Freezing",
-            }
-            
-            weather_descriptions = []
-            for wx in weather:
-                intensity = wx.get("intensity")
-                descriptor = wx.get("descriptor")
-                phenomenon = wx.get("phenomenon")
-                
-                description_parts = []
-                if intensity:
-                    description_parts.append(weather_code_descriptions.get(intensity, intensity))
-                if descriptor:
-                    description_parts.append(weather_code_descriptions.get(descriptor, descriptor))
-                if phenomenon:
-                    description_parts.append(weather_code_descriptions.get(phenomenon, phenomenon))
-                
-                description = " ".join(description_parts)
-                weather_descriptions.append(description.strip())
+            weather_descriptions = _describe_weather(weather)
             
             if weather_descriptions:
                 lines.append(f"Weather: {', '.join(weather_descriptions)}")
         
         # Clouds
         if 'clouds' in parsed_metar:
-            cloud_map = {
-                "FEW": "Few", "SCT": "Scattered", "BKN": "Broken",
-                "OVC": "Overcast", "NSC": "No Significant Cloud", "VV": "Vertical Visibility"
-            }
             lines.append("Clouds:")
             for cloud in parsed_metar['clouds']:
-                cloud_type = cloud_map.get(cloud['type'], cloud['type'])
-                height = cloud.get('height')
-                if height is not None:
-                    lines.append(f"  - {cloud_type} at {height * 100} feet")
-                else:
-                    lines.append(f"  - {cloud_type} at unknown height")
+                lines.append(f"  - {_describe_cloud(cloud['type'], cloud.get('height'))}")
         
         # Temperature/Dewpoint
         temperature = parsed_metar.get('temperature', 'N/A')
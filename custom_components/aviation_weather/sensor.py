@@ -1,7 +1,9 @@
 """Sensor platform for Aviation Weather integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
@@ -14,9 +16,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from . import AviationWeatherDataUpdateCoordinator
-from .const import DOMAIN
-from .metar_parser import parse_metar, format_metar
-from .taf_parser import parse_taf, format_taf
+from .const import DOMAIN, FORMATTED_OUTPUTS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -341,6 +341,22 @@ PARSED_TAF_SENSORS = {
     },
 }
 
+# Extra attributes exposed by specific parsed METAR sensors:
+# sensor key -> (attribute name, parsed METAR field)
+_METAR_ATTR_EXTRAS = {
+    "wind_direction": ("wind_full", "wind"),
+    "visibility": ("weather_phenomena", "weather"),
+    "cavok": ("cloud_layers", "clouds"),
+}
+
+# Complex parsed TAF fields exposed as attributes on every parsed TAF sensor
+_TAF_ATTR_FIELDS = (
+    "base_forecast",
+    "forecast_changes",
+    "temperature_forecast",
+    "qnh_forecast",
+)
+
 # Formatted output sensors
 FORMATTED_SENSORS = {
     "metar_readable_text": {
@@ -348,36 +364,42 @@ FORMATTED_SENSORS = {
         "icon": "mdi:text-box",
         "unit": None,
         "data_type": "metar_formatted",
+        "variant": "text",
     },
     "metar_readable_html": {
         "name": "METAR Readable (HTML)",
         "icon": "mdi:language-html5",
         "unit": None,
         "data_type": "metar_formatted",
+        "variant": "html",
     },
     "metar_readable_html_rich": {
         "name": "METAR Readable (Rich HTML)",
         "icon": "mdi:language-html5",
         "unit": None,
         "data_type": "metar_formatted",
+        "variant": "html_rich",
     },
     "taf_readable_text": {
         "name": "TAF Readable (Text)",
         "icon": "mdi:text-box-multiple",
         "unit": None,
         "data_type": "taf_formatted",
+        "variant": "text",
     },
     "taf_readable_html": {
         "name": "TAF Readable (HTML)",
         "icon": "mdi:language-html5",
         "unit": None,
         "data_type": "taf_formatted",
+        "variant": "html",
     },
     "taf_readable_html_rich": {
         "name": "TAF Readable (Rich HTML)",
         "icon": "mdi:language-html5",
         "unit": None,
         "data_type": "taf_formatted",
+        "variant": "html_rich",
     },
 }
 
@@ -441,9 +463,8 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-def _get_nested_value(data: dict, key_path: str) -> Any:
-    """Get a value from a nested dictionary using dot notation."""
-    keys = key_path.split('.')
+def _get_nested_value(data: dict, keys: tuple[str, ...]) -> Any:
+    """Get a value from a nested dictionary by a path of keys, e.g. ("wind", "direction")."""
     value = data
     for key in keys:
         if isinstance(value, dict):
@@ -471,6 +492,7 @@ class AviationWeatherSensor(CoordinatorEntity, SensorEntity):
         self._aerodrome = aerodrome
         self._sensor_key = sensor_key
         self._sensor_config = sensor_config
+        self._source_field = sensor_config.get("source_field", sensor_key)
         
         # Determine prefix based on data type
         data_type = sensor_config.get("data_type", "info")
@@ -526,11 +548,8 @@ class AviationWeatherSensor(CoordinatorEntity, SensorEntity):
         if not aerodrome_data:
             return None
         
-        # Check if this sensor uses a different source field
-        source_field = self._sensor_config.get("source_field", self._sensor_key)
-        
-        # Get value from API data first
-        value = aerodrome_data.get(source_field)
+        # Get value from API data first (source field may differ from sensor key)
+        value = aerodrome_data.get(self._source_field)
         
         # Special handling for rawTaf - ensure we get it even if it's not in the expected format
         if value is None and self._sensor_key == "rawTaf" and "rawTaf" in aerodrome_data:
@@ -644,6 +663,12 @@ class ParsedMetarSensor(CoordinatorEntity, SensorEntity):
         self._aerodrome = aerodrome
         self._sensor_key = sensor_key
         self._sensor_config = sensor_config
+        # Split a nested source field (e.g. "wind.direction") into its keys once
+        source_field = sensor_config.get("source_field", sensor_key)
+        self._source_path = (
+            tuple(sys.intern(key) for key in source_field.split(".")) if "." in source_field else None
+        )
+        self._attr_extra = _METAR_ATTR_EXTRAS.get(sensor_key)
         
         # Set unique ID
         self._attr_unique_id = f"{DOMAIN}_{aerodrome.lower()}_metar_parsed_{sensor_key}"
@@ -687,9 +712,8 @@ class ParsedMetarSensor(CoordinatorEntity, SensorEntity):
         parsed_metar = aerodrome_data["parsed_metar"]
         
         # Handle nested fields (e.g., "wind.direction")
-        source_field = self._sensor_config.get("source_field", self._sensor_key)
-        if "." in source_field:
-            return _get_nested_value(parsed_metar, source_field)
+        if self._source_path is not None:
+            return _get_nested_value(parsed_metar, self._source_path)
         
         return parsed_metar.get(self._sensor_key)
 
@@ -715,15 +739,11 @@ class ParsedMetarSensor(CoordinatorEntity, SensorEntity):
             attributes["raw_metar"] = aerodrome_data["rawOb"]
         
         # For complex fields like weather, clouds, etc., add full data
-        if "parsed_metar" in aerodrome_data:
+        if self._attr_extra and "parsed_metar" in aerodrome_data:
+            attr_name, field = self._attr_extra
             parsed = aerodrome_data["parsed_metar"]
-            
-            if self._sensor_key == "wind_direction" and "wind" in parsed:
-                attributes["wind_full"] = parsed["wind"]
-            elif self._sensor_key == "visibility" and "weather" in parsed:
-                attributes["weather_phenomena"] = parsed.get("weather", [])
-            elif self._sensor_key == "cavok" and "clouds" in parsed:
-                attributes["cloud_layers"] = parsed.get("clouds", [])
+            if field in parsed:
+                attributes[attr_name] = parsed[field]
         
         return attributes
 
@@ -753,6 +773,10 @@ class ParsedTafSensor(CoordinatorEntity, SensorEntity):
         self._aerodrome = aerodrome
         self._sensor_key = sensor_key
         self._sensor_config = sensor_config
+        source_field = sensor_config.get("source_field", sensor_key)
+        self._source_path = (
+            tuple(sys.intern(key) for key in source_field.split(".")) if "." in source_field else None
+        )
         
         # Set unique ID
         self._attr_unique_id = f"{DOMAIN}_{aerodrome.lower()}_taf_parsed_{sensor_key}"
@@ -796,9 +820,8 @@ class ParsedTafSensor(CoordinatorEntity, SensorEntity):
         parsed_taf = aerodrome_data["parsed_taf"]
         
         # Handle nested fields
-        source_field = self._sensor_config.get("source_field", self._sensor_key)
-        if "." in source_field:
-            return _get_nested_value(parsed_taf, source_field)
+        if self._source_path is not None:
+            return _get_nested_value(parsed_taf, self._source_path)
         
         return parsed_taf.get(self._sensor_key)
 
@@ -827,14 +850,9 @@ class ParsedTafSensor(CoordinatorEntity, SensorEntity):
         if "parsed_taf" in aerodrome_data:
             parsed = aerodrome_data["parsed_taf"]
             
-            if "base_forecast" in parsed:
-                attributes["base_forecast"] = parsed["base_forecast"]
-            if "forecast_changes" in parsed:
-                attributes["forecast_changes"] = parsed["forecast_changes"]
-            if "temperature_forecast" in parsed:
-                attributes["temperature_forecast"] = parsed["temperature_forecast"]
-            if "qnh_forecast" in parsed:
-                attributes["qnh_forecast"] = parsed["qnh_forecast"]
+            for field in _TAF_ATTR_FIELDS:
+                if field in parsed:
+                    attributes[field] = parsed[field]
         
         return attributes
 
@@ -851,6 +869,12 @@ class ParsedTafSensor(CoordinatorEntity, SensorEntity):
 class FormattedSensor(CoordinatorEntity, SensorEntity):
     """Representation of a formatted METAR or TAF sensor."""
 
+    # data_type -> (base attributes key, raw report key, raw report attribute)
+    _REPORT_KEYS = {
+        "metar_formatted": ("_base_metar_attrs", "rawOb", "raw_metar"),
+        "taf_formatted": ("_base_taf_attrs", "rawTaf", "raw_taf"),
+    }
+
     def __init__(
         self,
         coordinator: AviationWeatherDataUpdateCoordinator,
@@ -865,6 +889,18 @@ class FormattedSensor(CoordinatorEntity, SensorEntity):
         self._sensor_key = sensor_key
         self._sensor_config = sensor_config
         
+        # Resolve the coordinator data keys for this report type and variant once
+        data_type = sensor_config["data_type"]
+        self._base_key, self._raw_key, self._raw_attr = self._REPORT_KEYS[data_type]
+        self._formatted_key, _, _ = FORMATTED_OUTPUTS[
+            (data_type, sensor_config["variant"])
+        ]
+        self._len_key = f"{self._formatted_key}_len"
+        
+        # Attributes are rebuilt only when the coordinator replaces the data
+        self._attrs_source: dict[str, Any] | None = None
+        self._cached_attrs: dict[str, Any] = {}
+        
         # Set unique ID - use formatted_ prefix for consistency
         self._attr_unique_id = f"{DOMAIN}_{aerodrome.lower()}_formatted_{sensor_key}"
 
@@ -889,168 +925,54 @@ class FormattedSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor (character count)."""
-        if not self.coordinator.data:
+        try:
+            aerodrome_data = self.coordinator.data[self._aerodrome]
+        except (TypeError, KeyError):
+            # No data yet, or nothing fetched for this aerodrome
             return None
         
-        aerodrome_data = self.coordinator.data.get(self._aerodrome)
-        if not aerodrome_data:
-            return None
-        
-        data_type = self._sensor_config.get("data_type")
-        
-        if data_type == "metar_formatted":
-            # Check if parsing failed
-            if "parsed_metar" not in aerodrome_data:
-                return "Parse failed"
-            
-            # Check if formatting failed
-            parsed_metar = aerodrome_data["parsed_metar"]
-            if parsed_metar.get("_format_error"):
-                return "Format failed"
-            
-            # Get pre-formatted data from coordinator
-            if "html_rich" in self._sensor_key:
-                formatted = aerodrome_data.get("formatted_metar_html_rich")
-            elif "html" in self._sensor_key:
-                formatted = aerodrome_data.get("formatted_metar_html")
-            else:
-                formatted = aerodrome_data.get("formatted_metar_text")
-            
-            # Return character count as state (to avoid 255 char limit)
-            if formatted:
-                return f"{len(formatted)} chars"
-            else:
-                # Fallback: format now
-                try:
-                    if "html_rich" in self._sensor_key:
-                        result = format_metar(parsed_metar, eol="<br>", is_html=True)
-                    elif "html" in self._sensor_key:
-                        result = format_metar(parsed_metar, eol="<br>", is_html=False)
-                    else:
-                        result = format_metar(parsed_metar, eol="\n", is_html=False)
-                    return f"{len(result)} chars"
-                except Exception as err:
-                    return "Format error"
-        
-        elif data_type == "taf_formatted":
-            # Check if parsing failed
-            if "parsed_taf" not in aerodrome_data:
-                return "Parse failed"
-            
-            # Check if formatting failed
-            parsed_taf = aerodrome_data["parsed_taf"]
-            if parsed_taf.get("_format_error"):
-                return "Format failed"
-            
-            # Get pre-formatted data from coordinator
-            if "html_rich" in self._sensor_key:
-                formatted = aerodrome_data.get("formatted_taf_html_rich") 
-            elif "html" in self._sensor_key:
-                formatted = aerodrome_data.get("formatted_taf_html") 
-            else:
-                formatted = aerodrome_data.get("formatted_taf_text")
-            
-            # Return character count as state (to avoid 255 char limit)
-            if formatted:
-                return f"{len(formatted)} chars"
-            else:
-                # Fallback: format now
-                try:
-                    if "html_rich" in self._sensor_key:
-                        result = format_taf(parsed_taf, eol="<br>", is_html=True)
-                    elif "html" in self._sensor_key:
-                        result = format_taf(parsed_taf, eol="<br>", is_html=False)
-                    else:
-                        result = format_taf(parsed_taf, eol="\n", is_html=False)
-                    return f"{len(result)} chars"
-                except Exception as err:
-                    return "Format error"
-        
-        return None
+        # Character count of the pre-formatted output (to avoid 255 char limit).
+        # The coordinator stores "Format failed" here if formatting raised.
+        return aerodrome_data.get(self._len_key, "Parse failed")
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional state attributes with full formatted text."""
-        if not self.coordinator.data:
+        try:
+            aerodrome_data = self.coordinator.data[self._aerodrome]
+        except (TypeError, KeyError):
+            # No data yet, or nothing fetched for this aerodrome
             return {}
         
-        aerodrome_data = self.coordinator.data.get(self._aerodrome)
-        if not aerodrome_data:
-            return {}
+        if aerodrome_data is self._attrs_source:
+            return self._cached_attrs
         
-        attributes = {
-            ATTR_ATTRIBUTION: _ATTRIBUTION,
-            "aerodrome": self._aerodrome,
-            "data_source": "Formatted Output",
-            "last_updated": dt_util.now(),
-        }
+        base = aerodrome_data.get(self._base_key)
+        raw = aerodrome_data.get(self._raw_key)
         
-        data_type = self._sensor_config.get("data_type")
-        
-        if data_type == "metar_formatted":
-            if "rawOb" in aerodrome_data:
-                attributes["raw_metar"] = aerodrome_data["rawOb"]
-            if "parsed_metar" in aerodrome_data:
-                attributes["parse_success"] = True
-                
-                # Add the full formatted text to attributes
-                if "html_rich" in self._sensor_key:
-                    formatted = aerodrome_data.get("formatted_metar_html_rich")
-                elif "html" in self._sensor_key:
-                    formatted = aerodrome_data.get("formatted_metar_html")
-                else:
-                    formatted = aerodrome_data.get("formatted_metar_text")
-                
-                if formatted:
-                    attributes["formatted_output"] = formatted
-                else:
-                    # Fallback
-                    try:
-                        parsed_metar = aerodrome_data["parsed_metar"]
-                        if "html_rich" in self._sensor_key:
-                            formatted = format_metar(parsed_metar, eol="<br>", is_html=True)
-                        elif "html" in self._sensor_key:
-                            formatted = format_metar(parsed_metar, eol="<br>", is_html=False)
-                        else:
-                            formatted = format_metar(parsed_metar, eol="\n", is_html=False)
-                        attributes["formatted_output"] = formatted
-                    except Exception as err:
-                        attributes["formatted_output"] = f"Error: {err}"
-            else:
-                attributes["parse_success"] = False
-        
-        elif data_type == "taf_formatted":
-            if "rawTaf" in aerodrome_data:
-                attributes["raw_taf"] = aerodrome_data["rawTaf"]
-            if "parsed_taf" in aerodrome_data:
-                attributes["parse_success"] = True
-                
-                # Add the full formatted text to attributes
-                if "html_rich" in self._sensor_key:
-                    formatted = aerodrome_data.get("formatted_taf_html_rich")
-                elif "html" in self._sensor_key:
-                    formatted = aerodrome_data.get("formatted_taf_html")
-                else:
-                    formatted = aerodrome_data.get("formatted_taf_text")
-                
-                if formatted:
-                    attributes["formatted_output"] = formatted
-                else:
-                    # Fallback
-                    try:
-                        parsed_taf = aerodrome_data["parsed_taf"]
-                        if "html_rich" in self._sensor_key:
-                            formatted = format_taf(parsed_taf, eol="<br>", is_html=True)
-                        elif "html" in self._sensor_key:
-                            formatted = format_taf(parsed_taf, eol="<br>", is_html=False)
-                        else:
-                            formatted = format_taf(parsed_taf, eol="\n", is_html=False)
-                        attributes["formatted_output"] = formatted
-                    except Exception as err:
-                        attributes["formatted_output"] = f"Error: {err}"
-            else:
-                attributes["parse_success"] = False
+        if base is not None:
+            # Parsed report: base attributes are built once per update by the coordinator
+            attributes = {
+                ATTR_ATTRIBUTION: _ATTRIBUTION,
+                "last_updated": dt_util.now(),
+                **base,
+                "formatted_output": aerodrome_data.get(self._formatted_key),
+            }
+        else:
+            # No report, or one that failed to parse: the same keys either way,
+            # plus the raw text when there is one
+            attributes = {
+                ATTR_ATTRIBUTION: _ATTRIBUTION,
+                "aerodrome": self._aerodrome,
+                "data_source": "Formatted Output",
+                "last_updated": dt_util.now(),
+                "parse_success": False,
+            }
+            if raw is not None:
+                attributes[self._raw_attr] = raw
         
+        self._attrs_source = aerodrome_data
+        self._cached_attrs = attributes
         return attributes
 
     @property
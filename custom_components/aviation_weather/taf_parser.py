@@ -5,33 +5,132 @@ This module provides functions to parse and format TAF (Terminal Aerodrome Forec
 weather forecast data into structured dictionaries and human-readable text or HTML.
 
 Usage:
-    from taf_parser import parse_taf, format_taf
+    from taf_parser import parse_taf, parse_tafs, format_taf, format_tafs
     
     taf_string = "EGLL 121100Z 1212/1318 35010KT 9999 SCT025..."
     parsed_data = parse_taf(taf_string)
     formatted_text = format_taf(parsed_data)
     formatted_html = format_taf(parsed_data, is_html=True)
+    all_parsed = parse_tafs([taf_string, other_taf_string])
+    all_formatted = format_tafs(all_parsed)
 
 Author: ianpleasance
 Version: 2.4.2
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 
 __version__ = "2.4.2"
-__all__ = ["parse_taf", "format_taf"]
+__all__ = ["parse_taf", "parse_tafs", "format_taf", "format_tafs"]
 
+# Regular expressions, compiled once at import
 
-def _get_ordinal(n: int) -> str:
-    """Get the ordinal suffix for a given number."""
+# Forecast group elements
+_RE_FM = re.compile(r'FM(\d{6})')
+# One tokenizer for every forecast group element, scanned once per group.
+# At a given position the alternatives are tried in order, so the valid
+# period (DDHH/DDHH) is consumed before visibility can see its digits.
+# Weather phenomenon codes; several may follow one another in a single group (e.g. RADZ)
+_WX_PHENOMENA = r'DZ|RA|SN|SG|IC|PL|GR|GS|UP|BR|FG|FU|VA|DU|SA|HZ|PY|SQ|FC|SS|DS'
+_RE_GROUP_TOKENS = re.compile(
+    # Valid period
+    r'(?P<period>(?P<period_from>\d{4})/(?P<period_to>\d{4}))'
+    # Wind shear: WS followed by height and wind info
+    r'|(?P<wind_shear>\bWS(?P<ws_height>\d{3})/(?P<ws_dir>\d{3})(?P<ws_speed>\d{2,3})'
+    r'(?:G(?P<ws_gust>\d{2,3}))?(?P<ws_unit>KT|MPS|KMH)\b)'
+    # Wind: direction, speed, gusts, and unit
+    r'|(?P<wind>\b(?P<wind_dir>\d{3}|VRB)(?P<wind_speed>\d{2,3})'
+    r'(?:G(?P<wind_gust>\d{2,3}))?(?P<wind_unit>KT|MPS|KMH)\b)'
+    # Visibility: CAVOK, P6SM, 4-digit meters (not touching a '/', so a
+    # malformed period is not read as visibility), or SM (statute miles)
+    r'|(?P<visibility>\b(?:CAVOK|P6SM|(?<!/)\d{4}(?!/)|(?:\d+ )?\d+/\d+SM|\d+SM)\b)'
+    # Cloud layers
+    r'|(?P<cloud>\b(?P<cloud_type>FEW|SCT|BKN|OVC|VV|NSC|SKC)(?P<cloud_height>\d{3}|///)?'
+    r'(?P<cloud_conv>CB|TCU)?\b)'
+    # NSW (No Significant Weather) and VCSH (Showers in vicinity)
+    r'|(?P<nsw>\bNSW\b)'
+    r'|(?P<vcsh>\bVCSH\b)'
+    # Weather phenomena, starting a group or following another phenomenon so
+    # that letters inside other groups (e.g. the SS of station EGSS) are skipped
+    r'|(?P<weather>(?:(?<!\S)|(?<=' + _WX_PHENOMENA + r'))'
+    r'(?P<wx_intensity>-|\+|VC)?(?P<wx_descriptor>MI|PR|BC|DR|BL|SH|TS|FZ)?'
+    r'(?P<wx_phenomenon>' + _WX_PHENOMENA + r')(?=' + _WX_PHENOMENA + r'|\b))'
+)
+
+# TAF header, flags and whole-report elements
+# Station ID: May be preceded by "TAF", "TAF AMD", "TAF COR", etc.
+_RE_STATION = re.compile(r'(?:^|^TAF\s+(?:AMD\s+|COR\s+)?)([A-Z]{4})')
+_RE_ISSUE = re.compile(r'([A-Z]{4})\s+(\d{6})Z')
+# Report flags and RMK; longest alternatives first so AMD NOT SKED wins over AMD
+_RE_FLAGS = re.compile(r'\b(AMD NOT SKED|NIL TAF|AMD|COR|AUTO|RMK)\b')
+_RE_VALID_PERIOD = re.compile(r'(\d{6})Z\s+(\d{4})/(\d{4})')
+_RE_TEMPERATURE = re.compile(r'T([XN])(M?\d{2})/(\d{4})Z')
+_RE_QNH = re.compile(r'QNH(\d{4})INS')
+
+# Parsed flags set by each _RE_FLAGS match (AMD NOT SKED also means amended)
+_FLAG_KEYS = {
+    "AMD NOT SKED": ("is_amended", "amd_not_sked"),
+    "NIL TAF": ("is_nil",),
+    "AMD": ("is_amended",),
+    "COR": ("is_corrected",),
+    "AUTO": ("is_auto",),
+}
+
+# Change groups
+# Change indicators, keeping PROB30/PROB40 TEMPO together as one indicator
+_RE_CHANGE_INDICATORS = re.compile(r'\b(PROB(?:30|40)(?:\s+TEMPO)?|TEMPO|BECMG|FM\d{6})\b')
+# Anything but whitespace, to spot change indicators with no group body
+_RE_NON_SPACE = re.compile(r'\S')
+# Group type for each change indicator as written in the usual form
+_CHANGE_GROUP_TYPES = {
+    "PROB30 TEMPO": "PROB30 TEMPO",
+    "PROB40 TEMPO": "PROB40 TEMPO",
+    "PROB30": "PROB30",
+    "PROB40": "PROB40",
+    "TEMPO": "TEMPO",
+    "BECMG": "BECMG",
+}
+
+
+# Conversion factors to knots for wind units
+_KNOTS_FACTOR = {"KT": 1.0, "MPS": 1.94384, "KMH": 0.539957}
+
+
+def _to_knots(speed: int, gust: Optional[int], unit: str) -> Tuple[int, Optional[int]]:
+    """Convert a wind speed and optional gust to knots."""
+    factor = _KNOTS_FACTOR[unit]
+    if factor == 1.0:
+        return speed, gust
+    return round(speed * factor), (round(gust * factor) if gust else None)
+
+
+_ORDINAL_SUFFIXES = {1: 'st', 2: 'nd', 3: 'rd'}
+
+
+def _ordinal(n: int) -> str:
+    """Build the ordinal for a number, e.g. 1st, 12th, 22nd."""
     if 10 <= n % 100 <= 20:
         suffix = 'th'
     else:
-        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+        suffix = _ORDINAL_SUFFIXES.get(n % 10, 'th')
     return f"{n}{suffix}"
 
 
+# Ordinals for every day of the month, indexed by day
+_DAY_ORDINALS = tuple(_ordinal(n) for n in range(32))
+
+
+def _get_ordinal(n: int) -> str:
+    """Get the ordinal for a given number (days of the month are precomputed)."""
+    if 0 <= n < 32:
+        return _DAY_ORDINALS[n]
+    return _ordinal(n)
+
+
+# Large enough for every DDHH value (31 days x 24 hours) plus "N/A"
+@lru_cache(maxsize=1024)
 def _format_time_period(time_str: str) -> str:
     """
     Format a TAF time string (DDHH) into a human-readable format.
@@ -40,152 +139,163 @@ def _format_time_period(time_str: str) -> str:
         time_str: Time string in DDHH format (e.g., "2615" for 1500Z on the 26th)
         
     Returns:
-        Formatted string like "1500 on 26th"
+        Formatted string like "1500 on 26th", or time_str unchanged if it
+        isn't DDHH (so "N/A" passes straight through)
     """
-    if not time_str or len(time_str) != 4:
+    if not time_str or len(time_str) != 4 or not time_str.isdecimal():
         return time_str
     
-    try:
-        day = int(time_str[:2])
-        hour = int(time_str[2:])
-        return f"{hour:02d}00 on {_get_ordinal(day)}"
-    except (ValueError, TypeError):
-        return time_str
+    return f"{time_str[2:]}00 on {_get_ordinal(int(time_str[:2]))}"
 
 
-def _parse_forecast_group(group_text: str, group_type: str = "BASE") -> Dict[str, Any]:
+def _parse_forecast_group(text: str, start: int, end: int, group_type: str = "BASE") -> Dict[str, Any]:
     """
     Parse a single forecast group (BASE, TEMPO, BECMG, PROB, FM).
     
+    The group is scanned in place as text[start:end], without slicing it out.
+    
     Args:
-        group_text: The forecast group text to parse
+        text: The TAF text containing the forecast group
+        start: Index where the group starts in text
+        end: Index where the group ends in text
         group_type: Type of group (BASE, TEMPO, BECMG, PROB30, PROB40, FM)
         
     Returns:
         Dictionary containing parsed forecast group data
     """
-    forecast = {"type": group_type}
+    # Tokenize the group in a single pass; the first wind shear, wind,
+    # visibility and period tokens win, weather and clouds are collected
+    # (weather entries are built directly as they are found)
+    period_match = None
+    wind_shear_match = None
+    wind_match = None
+    visibility_match = None
+    weather = []
+    cloud_matches = []
+    has_nsw = False
+    has_vcsh = False
+    for token in _RE_GROUP_TOKENS.finditer(text, start, end):
+        kind = token.lastgroup
+        if kind == "weather":
+            intensity, descriptor, phenomenon = token.group('wx_intensity', 'wx_descriptor', 'wx_phenomenon')
+            weather.append({
+                "intensity": intensity,
+                "descriptor": descriptor,
+                "phenomenon": phenomenon
+            })
+        elif kind == "cloud":
+            cloud_matches.append(token)
+        elif kind == "wind":
+            if wind_match is None:
+                wind_match = token
+        elif kind == "visibility":
+            if visibility_match is None:
+                visibility_match = token
+        elif kind == "period":
+            if period_match is None:
+                period_match = token
+        elif kind == "wind_shear":
+            if wind_shear_match is None:
+                wind_shear_match = token
+        elif kind == "nsw":
+            has_nsw = True
+        elif kind == "vcsh":
+            has_vcsh = True
     
     # Valid period for TEMPO, BECMG, PROB, and PROB TEMPO combinations
-    if group_type in ["TEMPO", "BECMG", "PROB30", "PROB40", "PROB30 TEMPO", "PROB40 TEMPO"]:
-        period_match = re.search(r'(\d{4})/(\d{4})', group_text)
-        if period_match:
-            forecast['valid_from'] = period_match.group(1)
-            forecast['valid_to'] = period_match.group(2)
+    valid_from = None
+    valid_to = None
+    if period_match and group_type not in ("BASE", "FM"):
+        valid_from, valid_to = period_match.group('period_from', 'period_to')
     
     # FM (From) groups have a single timestamp
     if group_type == "FM":
-        fm_match = re.search(r'FM(\d{6})', group_text)
+        fm_match = _RE_FM.search(text, start, end)
         if fm_match:
-            forecast['valid_from'] = fm_match.group(1)
+            valid_from = fm_match.group(1)
     
     # Wind shear: WS followed by height and wind info
-    wind_shear_match = re.search(r'\bWS(\d{3})/(\d{3})(\d{2,3})(G(\d{2,3}))?(KT|MPS|KMH)\b', group_text)
+    wind_shear = None
     if wind_shear_match:
-        height = int(wind_shear_match.group(1))
-        direction = wind_shear_match.group(2)
-        speed = int(wind_shear_match.group(3))
-        gust = int(wind_shear_match.group(5)) if wind_shear_match.group(5) else None
-        unit = wind_shear_match.group(6)
-        
-        # Convert to knots
-        if unit == "MPS":
-            speed = round(speed * 1.94384)
-            gust = round(gust * 1.94384) if gust else None
-        elif unit == "KMH":
-            speed = round(speed * 0.539957)
-            gust = round(gust * 0.539957) if gust else None
+        height, direction, speed, gust, unit = wind_shear_match.group(
+            'ws_height', 'ws_dir', 'ws_speed', 'ws_gust', 'ws_unit'
+        )
+        speed, gust = _to_knots(int(speed), int(gust) if gust else None, unit)
         
-        forecast['wind_shear'] = {
-            "height": height * 100,  # Convert to feet
+        wind_shear = {
+            "height": int(height) * 100,  # Convert to feet
             "direction": direction,
             "speed": speed,
             "gust": gust
         }
     
     # Wind: direction, speed, gusts, and unit
-    wind_match = re.search(r'\b(\d{3}|VRB)(\d{2,3})(G(\d{2,3}))?(KT|MPS|KMH)\b', group_text)
+    wind = None
     if wind_match:
-        wind_direction = wind_match.group(1)
-        wind_speed = int(wind_match.group(2))
-        wind_gust = int(wind_match.group(4)) if wind_match.group(4) else None
-        wind_unit = wind_match.group(5)
-        
-        # Convert to knots
-        if wind_unit == "MPS":
-            wind_speed = round(wind_speed * 1.94384)
-            wind_gust = round(wind_gust * 1.94384) if wind_gust else None
-        elif wind_unit == "KMH":
-            wind_speed = round(wind_speed * 0.539957)
-            wind_gust = round(wind_gust * 0.539957) if wind_gust else None
+        wind_direction, wind_speed, wind_gust, wind_unit = wind_match.group(
+            'wind_dir', 'wind_speed', 'wind_gust', 'wind_unit'
+        )
+        wind_speed, wind_gust = _to_knots(int(wind_speed), int(wind_gust) if wind_gust else None, wind_unit)
         
-        forecast['wind'] = {
+        wind = {
             "direction": wind_direction,
             "speed": wind_speed,
             "gust": wind_gust
         }
     
     # Visibility: CAVOK, P6SM, 4-digit meters, or SM (statute miles)
-    # Need to exclude valid period patterns (DDHH/DDHH format)
-    visibility_match = re.search(r'\b(CAVOK|P6SM|(?<!/)\d{4}(?!/)|((\d+ )?\d+/\d+|(\d+))SM)\b', group_text)
+    visibility = None
     if visibility_match:
         visibility = visibility_match.group(0)
-        if visibility == "CAVOK":
-            forecast['visibility'] = "CAVOK"
-        elif "SM" in visibility:
-            forecast['visibility'] = f"{visibility} (statute miles)"
-        else:
-            forecast['visibility'] = f"{visibility} meters"
-    
-    # Weather phenomena - word boundary at end only to prevent matching within other codes
-    weather_match = re.findall(
-        r'(-|\+|VC)?(MI|BC|DR|BL|SH|TS|FZ)?(DZ|RA|SN|SG|IC|PL|GR|GS|UP|BR|FG|FU|VA|DU|SA|HZ|PY|SQ|FC|SS|DS)\b',
-        group_text
-    )
-    if weather_match:
-        forecast['weather'] = [
-            {
-                "intensity": match[0] if match[0] else None,
-                "descriptor": match[1] if match[1] else None,
-                "phenomenon": match[2]
-            }
-            for match in weather_match
-        ]
+        if "SM" in visibility:
+            visibility = f"{visibility} (statute miles)"
+        elif visibility != "CAVOK":
+            visibility = f"{visibility} meters"
     
-    # NSW (No Significant Weather)
-    if re.search(r'\bNSW\b', group_text):
-        forecast['weather'] = [{"phenomenon": "NSW"}]
+    # NSW (No Significant Weather) replaces any weather found
+    if has_nsw:
+        weather = [{"phenomenon": "NSW"}]
     
     # VCSH (Showers in vicinity)
-    if re.search(r'\bVCSH\b', group_text):
-        if 'weather' not in forecast:
-            forecast['weather'] = []
-        forecast['weather'].append({
+    if has_vcsh:
+        weather.append({
             "intensity": "VC",
             "descriptor": "SH",
             "phenomenon": "RA"
         })
     
     # Cloud layers
-    cloud_matches = re.findall(r'\b(FEW|SCT|BKN|OVC|VV|NSC|SKC)(\d{3}|///)?(CB|TCU)?\b', group_text)
-    if cloud_matches:
-        forecast['clouds'] = []
-        for cloud in cloud_matches:
-            cloud_type, height, convective = cloud
-            if height and height != '///':
-                try:
-                    height = int(height)
-                except ValueError:
-                    height = None
-            else:
+    clouds = []
+    for cloud in cloud_matches:
+        cloud_type, height, convective = cloud.group('cloud_type', 'cloud_height', 'cloud_conv')
+        if height and height != '///':
+            try:
+                height = int(height)
+            except ValueError:
                 height = None
-            
-            cloud_entry = {"type": cloud_type, "height": height}
-            if convective:
-                cloud_entry["convective"] = convective
-            forecast['clouds'].append(cloud_entry)
+        else:
+            height = None
+        
+        cloud_entry = {"type": cloud_type, "height": height}
+        if convective:
+            cloud_entry["convective"] = convective
+        clouds.append(cloud_entry)
     
-    return forecast
+    # Build the result once, leaving out anything the group doesn't report
+    return {
+        key: value
+        for key, value in (
+            ("type", group_type),
+            ("valid_from", valid_from),
+            ("valid_to", valid_to),
+            ("wind_shear", wind_shear),
+            ("wind", wind),
+            ("visibility", visibility),
+            ("weather", weather),
+            ("clouds", clouds),
+        )
+        if value
+    }
 
 
 def parse_taf(taf: str) -> Dict[str, Any]:
@@ -225,64 +335,60 @@ def parse_taf(taf: str) -> Dict[str, Any]:
     
     try:
         # Station ID: May be preceded by "TAF", "TAF AMD", "TAF COR", etc.
-        station_match = re.search(r'(?:^|^TAF\s+(?:AMD\s+|COR\s+)?)([A-Z]{4})', taf)
+        station_match = _RE_STATION.search(taf)
         if station_match:
             parsed['station_id'] = station_match.group(1)
         
         # Issue time: DDHHMM followed by Z
-        issue_match = re.search(r'([A-Z]{4})\s+(\d{6})Z', taf)
+        issue_match = _RE_ISSUE.search(taf)
         if issue_match:
             parsed['issue_time'] = issue_match.group(2)
         
-        # Check for AMD (amended) or COR (corrected)
-        parsed['is_amended'] = bool(re.search(r'\bAMD\b', taf))
-        parsed['is_corrected'] = bool(re.search(r'\bCOR\b', taf))
-        
-        # Check for NIL TAF (forecast suspended)
-        parsed['is_nil'] = bool(re.search(r'\bNIL TAF\b', taf))
-        
-        # Check for AUTO (automated)
-        parsed['is_auto'] = bool(re.search(r'\bAUTO\b', taf))
-        
-        # Check for AMD NOT SKED
-        parsed['amd_not_sked'] = bool(re.search(r'\bAMD NOT SKED\b', taf))
+        # Flags (AMD, COR, NIL TAF, AUTO, AMD NOT SKED) and the start of the
+        # RMK section, found in a single scan
+        parsed['is_amended'] = False
+        parsed['is_corrected'] = False
+        parsed['is_nil'] = False
+        parsed['is_auto'] = False
+        parsed['amd_not_sked'] = False
+        remarks_match = None
+        for flag_match in _RE_FLAGS.finditer(taf):
+            flag = flag_match.group(1)
+            if flag == 'RMK':
+                if remarks_match is None:
+                    remarks_match = flag_match
+            else:
+                for key in _FLAG_KEYS[flag]:
+                    parsed[key] = True
         
         # Valid period: DDHH/DDHH
-        valid_period_match = re.search(r'(\d{6})Z\s+(\d{4})/(\d{4})', taf)
+        valid_period_match = _RE_VALID_PERIOD.search(taf)
         if valid_period_match:
             parsed['valid_from'] = valid_period_match.group(2)
             parsed['valid_to'] = valid_period_match.group(3)
         
-        # Temperature forecast: TX and TN
+        # Temperature forecast: TX and TN in a single scan
         temp_forecast = {}
-        tx_match = re.findall(r'TX(M?\d{2})/(\d{4})Z', taf)
-        tn_match = re.findall(r'TN(M?\d{2})/(\d{4})Z', taf)
-        
-        if tx_match:
-            for temp, time in tx_match:
-                temp_value = int(temp.replace('M', '-'))
-                if 'max_temperature' not in temp_forecast:
-                    temp_forecast['max_temperature'] = []
-                temp_forecast['max_temperature'].append({
-                    "value": temp_value,
-                    "time": time
-                })
+        max_temps = []
+        min_temps = []
+        for temp_match in _RE_TEMPERATURE.finditer(taf):
+            kind, temp, time = temp_match.groups()
+            temp_value = -int(temp[1:]) if temp[0] == 'M' else int(temp)
+            (max_temps if kind == 'X' else min_temps).append({
+                "value": temp_value,
+                "time": time
+            })
         
-        if tn_match:
-            for temp, time in tn_match:
-                temp_value = int(temp.replace('M', '-'))
-                if 'min_temperature' not in temp_forecast:
-                    temp_forecast['min_temperature'] = []
-                temp_forecast['min_temperature'].append({
-                    "value": temp_value,
-                    "time": time
-                })
+        if max_temps:
+            temp_forecast['max_temperature'] = max_temps
+        if min_temps:
+            temp_forecast['min_temperature'] = min_temps
         
         if temp_forecast:
             parsed['temperature_forecast'] = temp_forecast
         
         # QNH forecast (pressure in inHg)
-        qnh_matches = re.findall(r'QNH(\d{4})INS', taf)
+        qnh_matches = _RE_QNH.findall(taf)
         if qnh_matches:
             parsed['qnh_forecast'] = [
                 {"unit": "inHg", "value": float(f"{qnh[:2]}.{qnh[2:]}")}
@@ -290,74 +396,44 @@ def parse_taf(taf: str) -> Dict[str, Any]:
             ]
         
         # Remove RMK section for main parsing
-        remarks_match = re.search(r'\bRMK\b(.*)', taf)
         if remarks_match:
-            parsed['remarks'] = remarks_match.group(1).strip()
-            taf_without_remarks = taf[:taf.index('RMK')].strip()
+            parsed['remarks'] = taf[remarks_match.end():].partition('\n')[0].strip()
+            taf_without_remarks = taf[:remarks_match.start()].strip()
         else:
             taf_without_remarks = taf
         
-        # Split TAF into base forecast and change groups
-        # First, extract the base forecast (everything before first change indicator)
-        change_indicators = r'\b(TEMPO|BECMG|PROB30|PROB40|FM\d{6})\b'
-        first_change = re.search(change_indicators, taf_without_remarks)
-        
-        if first_change:
-            base_text = taf_without_remarks[:first_change.start()].strip()
+        # Split TAF into base forecast and change groups with one scan for the
+        # change indicators: the base forecast is everything before the first,
+        # and each group runs from its indicator to the next one.
+        # A NIL TAF carries no forecast, so skip the change group scan entirely.
+        if parsed['is_nil']:
+            changes = []
         else:
-            base_text = taf_without_remarks.strip()
+            changes = list(_RE_CHANGE_INDICATORS.finditer(taf_without_remarks))
+        
+        base_end = changes[0].start() if changes else len(taf_without_remarks)
         
         # Parse base forecast
-        parsed['base_forecast'] = _parse_forecast_group(base_text, "BASE")
+        parsed['base_forecast'] = _parse_forecast_group(taf_without_remarks, 0, base_end, "BASE")
         
         # Parse change groups
-        if first_change:
-            changes_text = taf_without_remarks[first_change.start():].strip()
+        if changes:
             parsed['forecast_changes'] = []
             
-            # Find all change groups
-            # Handle PROB followed by TEMPO
-            prob_tempo_pattern = r'(PROB(?:30|40)\s+TEMPO\s+\d{4}/\d{4}\s+[^\n]+?)(?=\s+(?:TEMPO|BECMG|PROB(?:30|40)|FM\d{6})|$)'
-            prob_tempo_matches = list(re.finditer(prob_tempo_pattern, changes_text))
-            
-            # Find all other change groups
-            other_pattern = r'((?:TEMPO|BECMG|PROB(?:30|40)(?!\s+TEMPO)|FM\d{6})\s+[^\n]+?)(?=\s+(?:TEMPO|BECMG|PROB(?:30|40)|FM\d{6})|$)'
-            other_matches = list(re.finditer(other_pattern, changes_text))
-            
-            # Combine and sort by position
-            all_matches = prob_tempo_matches + other_matches
-            all_matches.sort(key=lambda x: x.start())
-            
-            # Remove overlapping matches (keep the longest/first match at each position)
-            filtered_matches = []
-            last_end = -1
-            for match in all_matches:
-                if match.start() >= last_end:
-                    filtered_matches.append(match)
-                    last_end = match.end()
-            
-            for match in filtered_matches:
-                group_text = match.group(1).strip()
-                
-                # Determine group type
-                if group_text.startswith('PROB30 TEMPO'):
-                    group_type = "PROB30 TEMPO"
-                elif group_text.startswith('PROB40 TEMPO'):
-                    group_type = "PROB40 TEMPO"
-                elif group_text.startswith('PROB30'):
-                    group_type = "PROB30"
-                elif group_text.startswith('PROB40'):
-                    group_type = "PROB40"
-                elif group_text.startswith('TEMPO'):
-                    group_type = "TEMPO"
-                elif group_text.startswith('BECMG'):
-                    group_type = "BECMG"
-                elif group_text.startswith('FM'):
-                    group_type = "FM"
-                else:
+            ends = [change.start() for change in changes[1:]]
+            ends.append(len(taf_without_remarks))
+            for change, end in zip(changes, ends):
+                if not _RE_NON_SPACE.search(taf_without_remarks, change.end(), end):
                     continue
+                indicator = change.group(1)
+                
+                # Group type from the indicator; FM carries its start time and
+                # PROB TEMPO may be split by any whitespace
+                group_type = _CHANGE_GROUP_TYPES.get(indicator)
+                if group_type is None:
+                    group_type = "FM" if indicator.startswith('FM') else " ".join(indicator.split())
                 
-                forecast_group = _parse_forecast_group(group_text, group_type)
+                forecast_group = _parse_forecast_group(taf_without_remarks, change.start(), end, group_type)
                 parsed['forecast_changes'].append(forecast_group)
     
     except Exception as e:
@@ -368,18 +444,47 @@ def parse_taf(taf: str) -> Dict[str, Any]:
 
 # HTML formatting helper functions
 
+# Emoji lookup tables for the HTML formatter
+_WIND_EMOJI_STRONG = "&#127786;&#65039;"
+_WIND_EMOJI_CALM = "&#127788;&#65039;"
+# (speed above, emoji), checked from the highest threshold down
+_WIND_EMOJI_THRESHOLDS = (
+    (30, _WIND_EMOJI_STRONG),
+    (10, "&#128168;"),
+)
+_CLOUD_EMOJI = {
+    "SKC": "&#9728;&#65039;",
+    "NSC": "&#9728;&#65039;",
+    "FEW": "&#9925;",
+    "SCT": "&#9925;",
+    "BKN": "&#9729;&#65039;",
+    "OVC": "&#9729;&#65039;",
+    "VV": "&#127787;&#65039;",
+}
+_CONVECTIVE_EMOJI = {
+    "CB": "&#9928;&#65039;",
+    "TCU": "&#127785;&#65039;",
+}
+_CHANGE_TYPE_EMOJI = {
+    "BASE": "&#127780;&#65039;",
+    "TEMPO": "&#9201;&#65039;",
+    "BECMG": "&#128200;",
+    "PROB30": "&#127922;",
+    "PROB40": "&#127922;",
+    "PROB30 TEMPO": "&#127922;",
+    "PROB40 TEMPO": "&#127922;",
+    "FM": "&#9193;"
+}
+
+
 def _get_wind_emoji(speed: int, gust: Optional[int] = None) -> str:
     """Get appropriate wind emoji based on speed."""
     if gust and gust > 25:
-        return "&#127786;&#65039;"
-    elif speed > 30:
-        return "&#127786;&#65039;"
-    elif speed > 20:
-        return "&#128168;"
-    elif speed > 10:
-        return "&#128168;"
-    else:
-        return "&#127788;&#65039;"
+        return _WIND_EMOJI_STRONG
+    for threshold, emoji in _WIND_EMOJI_THRESHOLDS:
+        if speed > threshold:
+            return emoji
+    return _WIND_EMOJI_CALM
 
 
 def _get_weather_emoji(weather_list: List[Dict[str, Any]]) -> str:
@@ -438,42 +543,17 @@ def _get_weather_emoji(weather_list: List[Dict[str, Any]]) -> str:
 
 def _get_cloud_emoji(cloud_type: str) -> str:
     """Get appropriate cloud emoji based on cloud type."""
-    if cloud_type in ['SKC', 'NSC']:
-        return "&#9728;&#65039;"
-    elif cloud_type == 'FEW':
-        return "&#9925;"
-    elif cloud_type == 'SCT':
-        return "&#9925;"
-    elif cloud_type in ['BKN', 'OVC']:
-        return "&#9729;&#65039;"
-    elif cloud_type == 'VV':
-        return "&#127787;&#65039;"
-    else:
-        return "&#9729;&#65039;"
+    return _CLOUD_EMOJI.get(cloud_type, "&#9729;&#65039;")
 
 
 def _get_convective_emoji(convective: str) -> str:
     """Get emoji for convective clouds."""
-    if convective == 'CB':
-        return "&#9928;&#65039;"
-    elif convective == 'TCU':
-        return "&#127785;&#65039;"
-    return ""
+    return _CONVECTIVE_EMOJI.get(convective, "")
 
 
 def _get_change_type_emoji(change_type: str) -> str:
     """Get emoji for forecast change type."""
-    emoji_map = {
-        "BASE": "&#127780;&#65039;",
-        "TEMPO": "&#9201;&#65039;",
-        "BECMG": "&#128200;",
-        "PROB30": "&#127922;",
-        "PROB40": "&#127922;",
-        "PROB30 TEMPO": "&#127922;",
-        "PROB40 TEMPO": "&#127922;",
-        "FM": "&#9193;"
-    }
-    return emoji_map.get(change_type, "&#128260;")
+    return _CHANGE_TYPE_EMOJI.get(change_type, "&#128260;")
 
 
 def _get_taf_css() -> str:
@@ -528,241 +608,321 @@ def _get_taf_css() -> str:
 </style>"""
 
 
-def _format_taf_html(parsed_taf: Dict[str, Any]) -> str:
-    """Format TAF data as HTML with embedded CSS and emoji."""
-    lines = []
-    lines.append('<div class="taf-report">')
-    lines.append(_get_taf_css())
+# Plain-language descriptions used by both formatters
+_WEATHER_DESCRIPTIONS = {
+    "DZ": "Drizzle", "RA": "Rain", "SN": "Snow", "SG": "Snow Grains",
+    "IC": "Ice Crystals", "PL": "Ice Pellets", "GR": "Hail",
+    "GS": "Small Hail/Snow Pellets", "UP": "Unknown Precipitation",
+    "BR": "Mist", "FG": "Fog", "FU": "Smoke", "VA": "Volcanic Ash",
+    "DU": "Dust", "SA": "Sand", "HZ": "Haze", "PY": "Spray",
+    "SQ": "Squall", "SS": "Sandstorm", "DS": "Duststorm",
+    "FC": "Funnel Cloud", "NSW": "No Significant Weather",
+    "+": "Heavy", "-": "Light", "VC": "In the vicinity",
+    "MI": "Shallow", "PR": "Partial", "BC": "Patches", "DR": "Drifting", "BL": "Blowing",
+    "SH": "Showers", "TS": "Thunderstorm", "FZ": "Freezing",
+}
+_CLOUD_NAMES = {
+    "FEW": "Few", "SCT": "Scattered", "BKN": "Broken", "OVC": "Overcast",
+    "NSC": "No Significant Cloud", "SKC": "Sky Clear", "VV": "Vertical Visibility"
+}
+_CONVECTIVE_DESCRIPTIONS = {
+    "CB": " (Cumulonimbus)",
+    "TCU": " (Towering Cumulus)"
+}
+
+
+# Report type flags, in display order; HTML marks amendments and corrections
+_TEXT_FLAGS = (
+    ("is_amended", "AMENDED"),
+    ("is_corrected", "CORRECTED"),
+    ("is_nil", "NIL (Forecast Suspended)"),
+    ("is_auto", "AUTOMATED"),
+    ("amd_not_sked", "AMD NOT SKED (Updates not scheduled)"),
+)
+_HTML_FLAGS = tuple(
+    (key, f"&#9888;&#65039; {label}" if key in ("is_amended", "is_corrected") else label)
+    for key, label in _TEXT_FLAGS
+)
+
+
+# Change group header templates; FM groups only have a start time
+_CHANGE_LABELS = {
+    "PROB30 TEMPO": "PROB30 TEMPORARY",
+    "PROB40 TEMPO": "PROB40 TEMPORARY",
+    "PROB30": "PROB30",
+    "PROB40": "PROB40",
+    "TEMPO": "TEMPORARY",
+    "BECMG": "BECOMING",
+}
+_TEXT_CHANGE_HEADERS = {
+    "FM": "  {i}. FROM {vf}:",
+    **{
+        change_type: f"  {{i}}. {label} {{vf}} to {{vt}}:"
+        for change_type, label in _CHANGE_LABELS.items()
+    },
+}
+_HTML_CHANGE_HEADERS = {
+    "FM": '    <h4 class="change-group">{i}. {emoji} <span class="change-type">FROM</span> {vf}:</h4>',
+    **{
+        change_type: f'    <h4 class="change-group">{{i}}. {{emoji}} <span class="change-type">{label}</span> {{vf}} to {{vt}}:</h4>'
+        for change_type, label in _CHANGE_LABELS.items()
+    },
+}
+
+# HTML report opening (with its stylesheet) and basic information templates
+_HTML_REPORT_OPEN = f'<div class="taf-report">\n{_get_taf_css()}'
+_HTML_REPORT_HEADER = (
+    '  <p><span class="label">Station:</span> {station}</p>\n'
+    '  <p><span class="label">Issue Time:</span> {issue}Z &#9200;</p>\n'
+    '  <p><span class="label">Valid Period:</span> &#128197; {vf} to {vt}</p>'
+)
+
+
+def _describe_weather(weather: List[Dict[str, Any]]) -> List[str]:
+    """Describe each weather phenomenon in plain language."""
+    weather_descriptions = []
+    for wx in weather:
+        intensity = wx.get("intensity")
+        descriptor = wx.get("descriptor")
+        phenomenon = wx.get("phenomenon")
+        
+        if not intensity and not descriptor:
+            # Bare phenomenon (the common case, and NSW): a single lookup
+            weather_descriptions.append(_WEATHER_DESCRIPTIONS.get(phenomenon, phenomenon) if phenomenon else "")
+            continue
+        
+        weather_descriptions.append(
+            " ".join(_WEATHER_DESCRIPTIONS.get(code, code) for code in (intensity, descriptor, phenomenon) if code)
+        )
+    return weather_descriptions
+
+
+def _describe_wind_shear(wind_shear: Dict[str, Any]) -> str:
+    """Describe a wind shear group, e.g. "Wind shear at 2000 feet: 270&#176; at 40 KT"."""
+    gust = wind_shear.get('gust')
+    gust_str = f" gusting to {gust} KT" if gust else ""
+    return (
+        f"Wind shear at {wind_shear.get('height', 0)} feet: "
+        f"{wind_shear.get('direction', 'N/A')}&#176; at {wind_shear.get('speed', 0)} KT{gust_str}"
+    )
+
+
+@lru_cache(maxsize=512)
+def _describe_wind(direction: str, speed: int, gust: Optional[int]) -> str:
+    """Describe a surface wind, e.g. "Variable at 5 KT" or "270&#176; at 20 KT gusting to 35 KT"."""
+    direction_str = "Variable" if direction == 'VRB' else f"{direction}&#176;"
+    gust_str = f" gusting to {gust} KT" if gust else ""
+    return f"{direction_str} at {speed} KT{gust_str}"
+
+
+@lru_cache(maxsize=512)
+def _describe_cloud(cloud_type: str, height: Optional[int], convective: str) -> str:
+    """Describe a cloud layer, e.g. "Broken at 1500 feet (Cumulonimbus)"."""
+    height_str = f"{height * 100} feet" if height is not None else "unknown height"
+    return f"{_CLOUD_NAMES.get(cloud_type, cloud_type)} at {height_str}{_CONVECTIVE_DESCRIPTIONS.get(convective, '')}"
+
+
+def _format_conditions_html(forecast: Dict[str, Any], indent: str = "    ") -> str:
+    """Format the conditions of a forecast group as HTML, one newline-terminated line each."""
+    condition_lines = []
+    
+    # Wind shear
+    wind_shear = forecast.get('wind_shear', {})
+    if wind_shear:
+        condition_lines.append(
+            f'{indent}<p><span class="label">Wind Shear:</span> &#128314; {_describe_wind_shear(wind_shear)}</p>'
+        )
+    
+    # Wind
+    wind = forecast.get('wind', {})
+    if wind:
+        speed = wind.get('speed', 0)
+        gust = wind.get('gust')
+        wind_emoji = _get_wind_emoji(speed, gust)
+        condition_lines.append(
+            f'{indent}<p><span class="label">Wind:</span> {wind_emoji} {_describe_wind(wind.get("direction", "N/A"), speed, gust)}</p>'
+        )
+    
+    # Visibility
+    visibility = forecast.get('visibility')
+    if visibility:
+        vis_emoji = "&#9728;&#65039;" if visibility == "CAVOK" else "&#128065;&#65039;"
+        condition_lines.append(f'{indent}<p><span class="label">Visibility:</span> {vis_emoji} {visibility}</p>')
+    
+    # Weather phenomena
+    weather = forecast.get('weather')
+    if weather:
+        weather_descriptions = _describe_weather(weather)
+        if weather_descriptions:
+            weather_emoji = _get_weather_emoji(weather)
+            condition_lines.append(f'{indent}<p><span class="label">Weather:</span> {weather_emoji} {", ".join(weather_descriptions)}</p>')
+    
+    # Clouds
+    clouds = forecast.get('clouds')
+    if clouds:
+        condition_lines.append(f'{indent}<p><span class="label">Clouds:</span></p>')
+        condition_lines.append(f'{indent}<ul>')
+        for cloud in clouds:
+            cloud_type = cloud['type']
+            convective = cloud.get('convective', '')
+            cloud_emoji = _get_cloud_emoji(cloud_type)
+            convective_emoji = _get_convective_emoji(convective) if convective else ""
+            description = _describe_cloud(cloud_type, cloud.get('height'), convective)
+            condition_lines.append(f'{indent}  <li>{cloud_emoji}{convective_emoji} {description}</li>')
+        condition_lines.append(f'{indent}</ul>')
+    
+    if not condition_lines:
+        return ""
+    condition_lines.append("")
+    return "\n".join(condition_lines)
+
+
+def _format_conditions_text(forecast: Dict[str, Any], indent: str = "", eol: str = "\n") -> str:
+    """Format the conditions of a forecast group as plain text, one eol-terminated line each."""
+    condition_lines = []
+    
+    # Wind shear
+    wind_shear = forecast.get('wind_shear', {})
+    if wind_shear:
+        condition_lines.append(f"{indent}Wind Shear: {_describe_wind_shear(wind_shear)}")
+    
+    # Wind
+    wind = forecast.get('wind', {})
+    if wind:
+        condition_lines.append(
+            f"{indent}Wind: {_describe_wind(wind.get('direction', 'N/A'), wind.get('speed', 0), wind.get('gust'))}"
+        )
+    
+    # Visibility
+    visibility = forecast.get('visibility')
+    if visibility:
+        condition_lines.append(f"{indent}Visibility: {visibility}")
+    
+    # Weather phenomena
+    weather = forecast.get('weather')
+    if weather:
+        weather_descriptions = _describe_weather(weather)
+        if weather_descriptions:
+            condition_lines.append(f"{indent}Weather: {', '.join(weather_descriptions)}")
+    
+    # Clouds
+    clouds = forecast.get('clouds')
+    if clouds:
+        condition_lines.append(f"{indent}Clouds:")
+        for cloud in clouds:
+            description = _describe_cloud(cloud['type'], cloud.get('height'), cloud.get('convective', ''))
+            condition_lines.append(f"{indent}  - {description}")
+    
+    if not condition_lines:
+        return ""
+    condition_lines.append("")
+    return eol.join(condition_lines)
+
+
+def _format_taf_html(parsed_taf: Dict[str, Any], eol: str = "\n") -> str:
+    """Format TAF data as HTML with embedded CSS and emoji (eol is not used)."""
+    lines = [_HTML_REPORT_OPEN]
+    
+    # The parse result is read once per key; bind the lookup
+    get = parsed_taf.get
     
     try:
-        # Basic Information
-        lines.append(f'  <p><span class="label">Station:</span> {parsed_taf.get("station_id", "N/A")}</p>')
-        lines.append(f'  <p><span class="label">Issue Time:</span> {parsed_taf.get("issue_time", "N/A")}Z &#9200;</p>')
-        
-        # Valid period
-        valid_from = parsed_taf.get('valid_from', 'N/A')
-        valid_to = parsed_taf.get('valid_to', 'N/A')
-        valid_from_formatted = _format_time_period(valid_from) if valid_from != 'N/A' else 'N/A'
-        valid_to_formatted = _format_time_period(valid_to) if valid_to != 'N/A' else 'N/A'
-        lines.append(f'  <p><span class="label">Valid Period:</span> &#128197; {valid_from_formatted} to {valid_to_formatted}</p>')
+        # Basic Information and valid period
+        lines.append(_HTML_REPORT_HEADER.format_map({
+            "station": get("station_id", "N/A"),
+            "issue": get("issue_time", "N/A"),
+            "vf": _format_time_period(get("valid_from", "N/A")),
+            "vt": _format_time_period(get("valid_to", "N/A")),
+        }))
         
         # Flags
-        flags = []
-        if parsed_taf.get('is_amended'):
-            flags.append("&#9888;&#65039; AMENDED")
-        if parsed_taf.get('is_corrected'):
-            flags.append("&#9888;&#65039; CORRECTED")
-        if parsed_taf.get('is_nil'):
-            flags.append("NIL (Forecast Suspended)")
-        if parsed_taf.get('is_auto'):
-            flags.append("AUTOMATED")
-        if parsed_taf.get('amd_not_sked'):
-            flags.append("AMD NOT SKED (Updates not scheduled)")
+        flags = [label for key, label in _HTML_FLAGS if get(key)]
         
         if flags:
             lines.append(f'  <p><span class="label">Type:</span> {", ".join(flags)}</p>')
         
-        # Helper function to format forecast conditions for HTML
-        def format_conditions_html(forecast: Dict[str, Any], indent: str = "    ") -> List[str]:
-            condition_lines = []
-            
-            # Wind shear
-            wind_shear = forecast.get('wind_shear', {})
-            if wind_shear:
-                height = wind_shear.get('height', 0)
-                direction = wind_shear.get('direction', 'N/A')
-                speed = wind_shear.get('speed', 0)
-                
-                ws_str = f"Wind shear at {height} feet: {direction}&#176; at {speed} KT"
-                if wind_shear.get('gust'):
-                    ws_str += f" gusting to {wind_shear['gust']} KT"
-                
-                condition_lines.append(f'{indent}<p><span class="label">Wind Shear:</span> &#128314; {ws_str}</p>')
-            
-            # Wind
-            wind = forecast.get('wind', {})
-            if wind:
-                direction = wind.get('direction', 'N/A')
-                speed = wind.get('speed', 0)
-                gust = wind.get('gust')
-                
-                wind_emoji = _get_wind_emoji(speed, gust)
-                
-                if direction == 'VRB':
-                    wind_str = f"Variable at {speed} KT"
-                else:
-                    wind_str = f"{direction}&#176; at {speed} KT"
-                
-                if gust:
-                    wind_str += f" gusting to {gust} KT"
-                
-                condition_lines.append(f'{indent}<p><span class="label">Wind:</span> {wind_emoji} {wind_str}</p>')
-            
-            # Visibility
-            visibility = forecast.get('visibility')
-            if visibility:
-                vis_emoji = "&#9728;&#65039;" if visibility == "CAVOK" else "&#128065;&#65039;"
-                condition_lines.append(f'{indent}<p><span class="label">Visibility:</span> {vis_emoji} {visibility}</p>')
-            
-            # Weather phenomena
-            weather = forecast.get('weather')
-            if weather:
-                weather_code_descriptions = {
-                    "DZ": "Drizzle", "RA": "Rain", "SN": "Snow", "SG": "Snow Grains",
-                    "IC": "Ice Crystals", "PL": "Ice Pellets", "GR": "Hail",
-                    "GS": "Small Hail/Snow Pellets", "UP": "Unknown Precipitation",
-                    "BR": "Mist", "FG": "Fog", "FU": "Smoke", "VA": "Volcanic Ash",
-                    "DU": "Dust", "SA": "Sand", "HZ": "Haze", "PY": "Spray",
-                    "SQ": "Squall", "SS": "Sandstorm", "DS": "Duststorm",
-                    "FC": "Funnel Cloud", "NSW": "No Significant Weather",
-                    "+": "Heavy", "-": "Light", "VC": "In the vicinity",
-                    "MI": "Shallow", "BC": "Patches", "DR": "Drifting", "BL": "Blowing",
-                    "SH": "Showers", "TS": "Thunderstorm", "FZ": "Freezing",
-                }
-                
-                weather_descriptions = []
-                for wx in weather:
-                    if wx.get("phenomenon") == "NSW":
-                        weather_descriptions.append("No Significant Weather")
-                        continue
-                    
-                    intensity = wx.get("intensity")
-                    descriptor = wx.get("descriptor")
-                    phenomenon = wx.get("phenomenon")
-                    
-                    description_parts = []
-                    if intensity:
-                        description_parts.append(weather_code_descriptions.get(intensity, intensity))
-                    if descriptor:
-                        description_parts.append(weather_code_descriptions.get(descriptor, descriptor))
-                    if phenomenon:
-                        description_parts.append(weather_code_descriptions.get(phenomenon, phenomenon))
-                    
-                    description = " ".join(description_parts)
-                    weather_descriptions.append(description.strip())
-                
-                if weather_descriptions:
-                    weather_emoji = _get_weather_emoji(weather)
-                    condition_lines.append(f'{indent}<p><span class="label">Weather:</span> {weather_emoji} {", ".join(weather_descriptions)}</p>')
-            
-            # Clouds
-            clouds = forecast.get('clouds')
-            if clouds:
-                cloud_map = {
-                    "FEW": "Few", "SCT": "Scattered", "BKN": "Broken", "OVC": "Overcast",
-                    "NSC": "No Significant Cloud", "SKC": "Sky Clear", "VV": "Vertical Visibility"
-                }
-                condition_lines.append(f'{indent}<p><span class="label">Clouds:</span></p>')
-                condition_lines.append(f'{indent}<ul>')
-                for cloud in clouds:
-                    cloud_type = cloud_map.get(cloud['type'], cloud['type'])
-                    height = cloud.get('height')
-                    convective = cloud.get('convective', '')
-                    
-                    cloud_emoji = _get_cloud_emoji(cloud['type'])
-                    convective_emoji = _get_convective_emoji(convective) if convective else ""
-                    
-                    convective_map = {
-                        "CB": " (Cumulonimbus)",
-                        "TCU": " (Towering Cumulus)"
-                    }
-                    convective_str = convective_map.get(convective, '')
-                    
-                    if height is not None:
-                        condition_lines.append(f'{indent}  <li>{cloud_emoji}{convective_emoji} {cloud_type} at {height * 100} feet{convective_str}</li>')
-                    else:
-                        condition_lines.append(f'{indent}  <li>{cloud_emoji}{convective_emoji} {cloud_type} at unknown height{convective_str}</li>')
-                condition_lines.append(f'{indent}</ul>')
-            
-            return condition_lines
-        
-        # Base Forecast
-        base_forecast = parsed_taf.get('base_forecast', {})
-        if base_forecast:
+        # Base Forecast, if it has any conditions besides its type (a NIL TAF
+        # carries no forecast to show)
+        base_forecast = get('base_forecast', {})
+        if not get('is_nil') and any(key != 'type' for key in base_forecast):
             base_emoji = _get_change_type_emoji("BASE")
-            lines.append(f'  <h3 class="forecast-section">{base_emoji} <span class="section-title">BASE FORECAST</span></h3>')
-            lines.append('  <div class="forecast-content">')
-            lines.extend(format_conditions_html(base_forecast, "    "))
-            lines.append('  </div>')
+            lines.append(
+                f'  <h3 class="forecast-section">{base_emoji} <span class="section-title">BASE FORECAST</span></h3>\n'
+                f'  <div class="forecast-content">\n'
+                f'{_format_conditions_html(base_forecast, "    ")}'
+                f'  </div>'
+            )
         
         # Forecast Changes
-        forecast_changes = parsed_taf.get('forecast_changes', [])
+        forecast_changes = get('forecast_changes', [])
         if forecast_changes:
-            lines.append(f'  <h3 class="forecast-section">&#128260; <span class="section-title">FORECAST CHANGES</span></h3>')
-            lines.append('  <div class="forecast-content">')
+            lines.append(
+                f'  <h3 class="forecast-section">&#128260; <span class="section-title">FORECAST CHANGES</span></h3>\n'
+                f'  <div class="forecast-content">'
+            )
             for i, change in enumerate(forecast_changes, 1):
                 change_type = change.get('type', 'UNKNOWN')
                 change_emoji = _get_change_type_emoji(change_type)
                 
-                # Format header based on type
-                if change_type == "FM":
-                    fm_time = change.get("valid_from", "N/A")
-                    fm_formatted = _format_time_period(fm_time) if fm_time != "N/A" else "N/A"
-                    lines.append(f'    <h4 class="change-group">{i}. {change_emoji} <span class="change-type">FROM</span> {fm_formatted}:</h4>')
-                elif change_type in ["PROB30 TEMPO", "PROB40 TEMPO"]:
-                    prob = change_type.split()[0]
-                    from_time = change.get("valid_from", "N/A")
-                    to_time = change.get("valid_to", "N/A")
-                    from_formatted = _format_time_period(from_time) if from_time != "N/A" else "N/A"
-                    to_formatted = _format_time_period(to_time) if to_time != "N/A" else "N/A"
-                    lines.append(f'    <h4 class="change-group">{i}. {change_emoji} <span class="change-type">{prob} TEMPORARY</span> {from_formatted} to {to_formatted}:</h4>')
-                elif change_type in ["PROB30", "PROB40"]:
-                    from_time = change.get("valid_from", "N/A")
-                    to_time = change.get("valid_to", "N/A")
-                    from_formatted = _format_time_period(from_time) if from_time != "N/A" else "N/A"
-                    to_formatted = _format_time_period(to_time) if to_time != "N/A" else "N/A"
-                    lines.append(f'    <h4 class="change-group">{i}. {change_emoji} <span class="change-type">{change_type}</span> {from_formatted} to {to_formatted}:</h4>')
-                elif change_type == "TEMPO":
-                    from_time = change.get("valid_from", "N/A")
-                    to_time = change.get("valid_to", "N/A")
-                    from_formatted = _format_time_period(from_time) if from_time != "N/A" else "N/A"
-                    to_formatted = _format_time_period(to_time) if to_time != "N/A" else "N/A"
-                    lines.append(f'    <h4 class="change-group">{i}. {change_emoji} <span class="change-type">TEMPORARY</span> {from_formatted} to {to_formatted}:</h4>')
-                elif change_type == "BECMG":
-                    from_time = change.get("valid_from", "N/A")
-                    to_time = change.get("valid_to", "N/A")
-                    from_formatted = _format_time_period(from_time) if from_time != "N/A" else "N/A"
-                    to_formatted = _format_time_period(to_time) if to_time != "N/A" else "N/A"
-                    lines.append(f'    <h4 class="change-group">{i}. {change_emoji} <span class="change-type">BECOMING</span> {from_formatted} to {to_formatted}:</h4>')
+                # Format header from the template for this change type
+                header = ""
+                template = _HTML_CHANGE_HEADERS.get(change_type)
+                if template:
+                    header = template.format_map({
+                        "i": i,
+                        "emoji": change_emoji,
+                        "vf": _format_time_period(change.get("valid_from", "N/A")),
+                        "vt": _format_time_period(change.get("valid_to", "N/A")),
+                    }) + "\n"
                 
-                lines.append('    <div class="change-content">')
-                lines.extend(format_conditions_html(change, "      "))
-                lines.append('    </div>')
+                lines.append(
+                    f'{header}    <div class="change-content">\n'
+                    f'{_format_conditions_html(change, "      ")}'
+                    f'    </div>'
+                )
             lines.append('  </div>')
         
         # Temperature Forecast
-        temp_forecast = parsed_taf.get('temperature_forecast', {})
+        temp_forecast = get('temperature_forecast', {})
         if temp_forecast:
-            lines.append(f'  <h3 class="forecast-section">&#127777;&#65039; <span class="section-title">TEMPERATURE FORECAST</span></h3>')
-            lines.append('  <div class="forecast-content">')
-            
-            max_temps = temp_forecast.get('max_temperature', [])
-            for max_temp in max_temps:
-                lines.append(f'    <p><span class="label">Maximum:</span> &#127777;&#65039; {max_temp["value"]}&#176;C at {max_temp["time"]}Z</p>')
-            
-            min_temps = temp_forecast.get('min_temperature', [])
-            for min_temp in min_temps:
-                lines.append(f'    <p><span class="label">Minimum:</span> &#127777;&#65039; {min_temp["value"]}&#176;C at {min_temp["time"]}Z</p>')
-            
-            lines.append('  </div>')
+            temp_lines = [
+                f'  <h3 class="forecast-section">&#127777;&#65039; <span class="section-title">TEMPERATURE FORECAST</span></h3>',
+                '  <div class="forecast-content">',
+            ]
+            temp_lines.extend(
+                f'    <p><span class="label">Maximum:</span> &#127777;&#65039; {max_temp["value"]}&#176;C at {max_temp["time"]}Z</p>'
+                for max_temp in temp_forecast.get('max_temperature', [])
+            )
+            temp_lines.extend(
+                f'    <p><span class="label">Minimum:</span> &#127777;&#65039; {min_temp["value"]}&#176;C at {min_temp["time"]}Z</p>'
+                for min_temp in temp_forecast.get('min_temperature', [])
+            )
+            temp_lines.append('  </div>')
+            lines.append("\n".join(temp_lines))
         
         # QNH Forecast
-        qnh_forecast = parsed_taf.get('qnh_forecast', [])
+        qnh_forecast = get('qnh_forecast', [])
         if qnh_forecast:
-            lines.append(f'  <h3 class="forecast-section">&#128317; <span class="section-title">PRESSURE FORECAST</span></h3>')
-            lines.append('  <div class="forecast-content">')
-            for i, qnh in enumerate(qnh_forecast, 1):
-                lines.append(f'    <p>{i}. <span class="label">QNH:</span> &#128317; {qnh["value"]} {qnh["unit"]}</p>')
-            lines.append('  </div>')
+            qnh_lines = "".join(
+                f'    <p>{i}. <span class="label">QNH:</span> &#128317; {qnh["value"]} {qnh["unit"]}</p>\n'
+                for i, qnh in enumerate(qnh_forecast, 1)
+            )
+            lines.append(
+                f'  <h3 class="forecast-section">&#128317; <span class="section-title">PRESSURE FORECAST</span></h3>\n'
+                f'  <div class="forecast-content">\n'
+                f'{qnh_lines}'
+                f'  </div>'
+            )
         
         # Remarks
-        remarks = parsed_taf.get('remarks')
+        remarks = get('remarks')
         if remarks:
             lines.append(f'  <p><span class="label">Remarks:</span> {remarks}</p>')
         
         # Parse error if present
-        if 'parse_error' in parsed_taf:
-            lines.append(f'  <p><span class="label">Parse Error:</span> {parsed_taf["parse_error"]}</p>')
+        parse_error = get('parse_error')
+        if parse_error is not None:
+            lines.append(f'  <p><span class="label">Parse Error:</span> {parse_error}</p>')
     
     except Exception as e:
         lines.append(f'  <p><span class="label">Formatting Error:</span> {str(e)}</p>')
@@ -775,223 +935,87 @@ def _format_taf_text(parsed_taf: Dict[str, Any], eol: str = "\n") -> str:
     """Format TAF data as plain text."""
     lines = []
     
+    # The parse result is read once per key; bind the lookup
+    get = parsed_taf.get
+    
     try:
-        # Basic Information
-        lines.append(f"Station: {parsed_taf.get('station_id', 'N/A')}")
-        lines.append(f"Issue Time: {parsed_taf.get('issue_time', 'N/A')}Z")
-        
-        # Valid period
-        valid_from = parsed_taf.get('valid_from', 'N/A')
-        valid_to = parsed_taf.get('valid_to', 'N/A')
-        valid_from_formatted = _format_time_period(valid_from) if valid_from != 'N/A' else 'N/A'
-        valid_to_formatted = _format_time_period(valid_to) if valid_to != 'N/A' else 'N/A'
-        lines.append(f"Valid Period: {valid_from_formatted} to {valid_to_formatted}")
+        # Basic Information and valid period
+        valid_from = get('valid_from', 'N/A')
+        valid_to = get('valid_to', 'N/A')
+        valid_from_formatted = _format_time_period(valid_from)
+        valid_to_formatted = _format_time_period(valid_to)
+        lines.append(
+            f"Station: {get('station_id', 'N/A')}{eol}"
+            f"Issue Time: {get('issue_time', 'N/A')}Z{eol}"
+            f"Valid Period: {valid_from_formatted} to {valid_to_formatted}"
+        )
         
         # Flags
-        flags = []
-        if parsed_taf.get('is_amended'):
-            flags.append("AMENDED")
-        if parsed_taf.get('is_corrected'):
-            flags.append("CORRECTED")
-        if parsed_taf.get('is_nil'):
-            flags.append("NIL (Forecast Suspended)")
-        if parsed_taf.get('is_auto'):
-            flags.append("AUTOMATED")
-        if parsed_taf.get('amd_not_sked'):
-            flags.append("AMD NOT SKED (Updates not scheduled)")
+        flags = [label for key, label in _TEXT_FLAGS if get(key)]
         
         if flags:
             lines.append(f"Type: {', '.join(flags)}")
         
         lines.append("")
         
-        # Helper function to format forecast conditions
-        def format_conditions(forecast: Dict[str, Any], indent: str = "") -> List[str]:
-            condition_lines = []
-            
-            # Wind shear
-            wind_shear = forecast.get('wind_shear', {})
-            if wind_shear:
-                height = wind_shear.get('height', 0)
-                direction = wind_shear.get('direction', 'N/A')
-                speed = wind_shear.get('speed', 0)
-                
-                ws_str = f"Wind shear at {height} feet: {direction}&#176; at {speed} KT"
-                
-                if wind_shear.get('gust'):
-                    ws_str += f" gusting to {wind_shear['gust']} KT"
-                
-                condition_lines.append(f"{indent}Wind Shear: {ws_str}")
-            
-            # Wind
-            wind = forecast.get('wind', {})
-            if wind:
-                direction = wind.get('direction', 'N/A')
-                speed = wind.get('speed', 0)
-                
-                if direction == 'VRB':
-                    wind_str = f"Variable at {speed} KT"
-                else:
-                    wind_str = f"{direction}&#176; at {speed} KT"
-                
-                if wind.get('gust'):
-                    wind_str += f" gusting to {wind['gust']} KT"
-                
-                condition_lines.append(f"{indent}Wind: {wind_str}")
-            
-            # Visibility
-            visibility = forecast.get('visibility')
-            if visibility:
-                condition_lines.append(f"{indent}Visibility: {visibility}")
-            
-            # Weather phenomena
-            weather = forecast.get('weather')
-            if weather:
-                weather_code_descriptions = {
-                    "DZ": "Drizzle", "RA": "Rain", "SN": "Snow", "SG": "Snow Grains",
-                    "IC": "Ice Crystals", "PL": "Ice Pellets", "GR": "Hail",
-                    "GS": "Small Hail/Snow Pellets", "UP": "Unknown Precipitation",
-                    "BR": "Mist", "FG": "Fog", "FU": "Smoke", "VA": "Volcanic Ash",
-                    "DU": "Dust", "SA": "Sand", "HZ": "Haze", "PY": "Spray",
-                    "SQ": "Squall", "SS": "Sandstorm", "DS": "Duststorm",
-                    "FC": "Funnel Cloud", "NSW": "No Significant Weather",
-                    "+": "Heavy", "-": "Light", "VC": "In the vicinity",
-                    "MI": "Shallow", "BC": "Patches", "DR": "Drifting", "BL": "Blowing",
-                    "SH": "Showers", "TS": "Thunderstorm", "FZ": "Freezing",
-                }
-                
-                weather_descriptions = []
-                for wx in weather:
-                    if wx.get("phenomenon") == "NSW":
-                        weather_descriptions.append("No Significant Weather")
-                        continue
-                    
-                    intensity = wx.get("intensity")
-                    descriptor = wx.get("descriptor")
-                    phenomenon = wx.get("phenomenon")
-                    
-                    description_parts = []
-                    if intensity:
-                        intensity_desc = weather_code_descriptions.get(intensity, intensity)
-                        description_parts.append(intensity_desc)
-                    if descriptor:
-                        descriptor_desc = weather_code_descriptions.get(descriptor, descriptor)
-                        description_parts.append(descriptor_desc)
-                    if phenomenon:
-                        phenomenon_desc = weather_code_descriptions.get(phenomenon, phenomenon)
-                        description_parts.append(phenomenon_desc)
-                    
-                    description = " ".join(description_parts)
-                    weather_descriptions.append(description.strip())
-                
-                if weather_descriptions:
-                    condition_lines.append(f"{indent}Weather: {', '.join(weather_descriptions)}")
-            
-            # Clouds
-            clouds = forecast.get('clouds')
-            if clouds:
-                cloud_map = {
-                    "FEW": "Few", "SCT": "Scattered", "BKN": "Broken", "OVC": "Overcast",
-                    "NSC": "No Significant Cloud", "SKC": "Sky Clear", "VV": "Vertical Visibility"
-                }
-                condition_lines.append(f"{indent}Clouds:")
-                for cloud in clouds:
-                    cloud_type = cloud_map.get(cloud['type'], cloud['type'])
-                    height = cloud.get('height')
-                    convective = cloud.get('convective', '')
-                    
-                    convective_map = {
-                        "CB": " (Cumulonimbus)",
-                        "TCU": " (Towering Cumulus)"
-                    }
-                    convective_str = convective_map.get(convective, '')
-                    
-                    if height is not None:
-                        condition_lines.append(f"{indent}  - {cloud_type} at {height * 100} feet{convective_str}")
-                    else:
-                        condition_lines.append(f"{indent}  - {cloud_type} at unknown height{convective_str}")
-            
-            return condition_lines
-        
-        # Base Forecast
-        base_forecast = parsed_taf.get('base_forecast', {})
-        if base_forecast:
-            lines.append("BASE FORECAST:")
-            lines.extend(format_conditions(base_forecast, "  "))
-            lines.append("")
+        # Base Forecast, if it has any conditions besides its type (a NIL TAF
+        # carries no forecast to show)
+        base_forecast = get('base_forecast', {})
+        if not get('is_nil') and any(key != 'type' for key in base_forecast):
+            lines.append(f"BASE FORECAST:{eol}{_format_conditions_text(base_forecast, '  ', eol)}")
         
         # Forecast Changes
-        forecast_changes = parsed_taf.get('forecast_changes', [])
+        forecast_changes = get('forecast_changes', [])
         if forecast_changes:
             lines.append("FORECAST CHANGES:")
             for i, change in enumerate(forecast_changes, 1):
                 change_type = change.get('type', 'UNKNOWN')
                 
-                # Format header based on type
-                if change_type == "FM":
-                    fm_time = change.get('valid_from', 'N/A')
-                    fm_formatted = _format_time_period(fm_time) if fm_time != 'N/A' else 'N/A'
-                    lines.append(f"  {i}. FROM {fm_formatted}:")
-                elif change_type in ["PROB30 TEMPO", "PROB40 TEMPO"]:
-                    prob = change_type.split()[0]
-                    from_time = change.get('valid_from', 'N/A')
-                    to_time = change.get('valid_to', 'N/A')
-                    from_formatted = _format_time_period(from_time) if from_time != 'N/A' else 'N/A'
-                    to_formatted = _format_time_period(to_time) if to_time != 'N/A' else 'N/A'
-                    lines.append(f"  {i}. {prob} TEMPORARY {from_formatted} to {to_formatted}:")
-                elif change_type in ["PROB30", "PROB40"]:
-                    from_time = change.get('valid_from', 'N/A')
-                    to_time = change.get('valid_to', 'N/A')
-                    from_formatted = _format_time_period(from_time) if from_time != 'N/A' else 'N/A'
-                    to_formatted = _format_time_period(to_time) if to_time != 'N/A' else 'N/A'
-                    lines.append(f"  {i}. {change_type} {from_formatted} to {to_formatted}:")
-                elif change_type == "TEMPO":
-                    from_time = change.get('valid_from', 'N/A')
-                    to_time = change.get('valid_to', 'N/A')
-                    from_formatted = _format_time_period(from_time) if from_time != 'N/A' else 'N/A'
-                    to_formatted = _format_time_period(to_time) if to_time != 'N/A' else 'N/A'
-                    lines.append(f"  {i}. TEMPORARY {from_formatted} to {to_formatted}:")
-                elif change_type == "BECMG":
-                    from_time = change.get('valid_from', 'N/A')
-                    to_time = change.get('valid_to', 'N/A')
-                    from_formatted = _format_time_period(from_time) if from_time != 'N/A' else 'N/A'
-                    to_formatted = _format_time_period(to_time) if to_time != 'N/A' else 'N/A'
-                    lines.append(f"  {i}. BECOMING {from_formatted} to {to_formatted}:")
+                # Format header from the template for this change type
+                header = ""
+                template = _TEXT_CHANGE_HEADERS.get(change_type)
+                if template:
+                    header = template.format_map({
+                        "i": i,
+                        "vf": _format_time_period(change.get('valid_from', 'N/A')),
+                        "vt": _format_time_period(change.get('valid_to', 'N/A')),
+                    }) + eol
                 
-                lines.extend(format_conditions(change, "     "))
-                lines.append("")
+                lines.append(f"{header}{_format_conditions_text(change, '     ', eol)}")
         
         # Temperature Forecast
-        temp_forecast = parsed_taf.get('temperature_forecast', {})
+        temp_forecast = get('temperature_forecast', {})
         if temp_forecast:
-            lines.append("TEMPERATURE FORECAST:")
-            
-            max_temps = temp_forecast.get('max_temperature', [])
-            for max_temp in max_temps:
-                lines.append(f"  Maximum: {max_temp['value']}&#176;C at {max_temp['time']}Z")
-            
-            min_temps = temp_forecast.get('min_temperature', [])
-            for min_temp in min_temps:
-                lines.append(f"  Minimum: {min_temp['value']}&#176;C at {min_temp['time']}Z")
-            
-            lines.append("")
+            temp_lines = ["TEMPERATURE FORECAST:"]
+            temp_lines.extend(
+                f"  Maximum: {max_temp['value']}&#176;C at {max_temp['time']}Z"
+                for max_temp in temp_forecast.get('max_temperature', [])
+            )
+            temp_lines.extend(
+                f"  Minimum: {min_temp['value']}&#176;C at {min_temp['time']}Z"
+                for min_temp in temp_forecast.get('min_temperature', [])
+            )
+            temp_lines.append("")
+            lines.append(eol.join(temp_lines))
         
         # QNH Forecast
-        qnh_forecast = parsed_taf.get('qnh_forecast', [])
+        qnh_forecast = get('qnh_forecast', [])
         if qnh_forecast:
-            lines.append("PRESSURE FORECAST:")
-            for i, qnh in enumerate(qnh_forecast, 1):
-                lines.append(f"  {i}. QNH: {qnh['value']} {qnh['unit']}")
-            lines.append("")
+            qnh_lines = "".join(
+                f"  {i}. QNH: {qnh['value']} {qnh['unit']}{eol}"
+                for i, qnh in enumerate(qnh_forecast, 1)
+            )
+            lines.append(f"PRESSURE FORECAST:{eol}{qnh_lines}")
         
         # Remarks
-        remarks = parsed_taf.get('remarks')
+        remarks = get('remarks')
         if remarks:
             lines.append(f"Remarks: {remarks}")
         
         # Parse error if present
-        if 'parse_error' in parsed_taf:
-            lines.append(f"Parse Error: {parsed_taf['parse_error']}")
+        parse_error = get('parse_error')
+        if parse_error is not None:
+            lines.append(f"Parse Error: {parse_error}")
     
     except Exception as e:
         lines.append(f"Formatting Error: {str(e)}")
@@ -999,6 +1023,29 @@ def _format_taf_text(parsed_taf: Dict[str, Any], eol: str = "\n") -> str:
     return eol.join(lines)
 
 
+# Formatter for each output format, keyed by is_html
+_TAF_FORMATTERS = {
+    False: _format_taf_text,
+    True: _format_taf_html,
+}
+
+
+def parse_tafs(tafs: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Parse several TAF strings, e.g. one per station.
+    
+    Parsing is CPU-bound Python and regex work that holds the GIL, so the
+    reports are parsed in turn; a thread pool would only add overhead.
+    
+    Args:
+        tafs: TAF weather forecast strings
+        
+    Returns:
+        A list of dictionaries as returned by parse_taf(), in input order
+    """
+    return [parse_taf(taf) for taf in tafs]
+
+
 def format_taf(parsed_taf: Dict[str, Any], eol: str = "\n", is_html: bool = False) -> str:
     """
     Format parsed TAF data into a human-readable string or HTML.
@@ -1020,7 +1067,25 @@ def format_taf(parsed_taf: Dict[str, Any], eol: str = "\n", is_html: bool = Fals
     if not parsed_taf or not isinstance(parsed_taf, dict):
         return "Invalid TAF data"
     
-    if is_html:
-        return _format_taf_html(parsed_taf)
-    else:
-        return _format_taf_text(parsed_taf, eol)
+    return _TAF_FORMATTERS[bool(is_html)](parsed_taf, eol)
+
+
+def format_tafs(parsed_tafs: Iterable[Dict[str, Any]], eol: str = "\n", is_html: bool = False) -> List[str]:
+    """
+    Format several parsed TAFs, e.g. the output of parse_tafs().
+    
+    The formatter is chosen once for the whole batch rather than per report.
+    
+    Args:
+        parsed_tafs: Dictionaries returned by parse_taf()
+        eol: End-of-line character(s) to use (default: newline) - only for text format
+        is_html: If True, return HTML formatted output with embedded CSS and emoji
+        
+    Returns:
+        A list of formatted strings as returned by format_taf(), in input order
+    """
+    formatter = _TAF_FORMATTERS[bool(is_html)]
+    return [
+        formatter(parsed_taf, eol) if parsed_taf and isinstance(parsed_taf, dict) else "Invalid TAF data"
+        for parsed_taf in parsed_tafs
+    ]